@@ -0,0 +1,89 @@
+"""Schneller Kaltstart: Font-Pfad auf Platte merken, Spiel-Assets im Hintergrund laden.
+
+``resolve_font`` fragt die Emoji-Fonts nur beim allerersten Start über das
+System ab (unter Linux fontconfig, das dauert) und merkt sich den gefundenen
+Pfad in ``fontcache.json`` im Datenordner; ohne passenden Font wird bei jedem
+Start neu gesucht, damit ein später installierter Font gefunden wird. ``Preloader`` dekodiert Bilder und
+Sounds, die erst im Spiel gebraucht werden, während das Menü schon läuft.
+"""
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from highscore import DATA_DIR
+
+FONT_CACHE = os.path.join(DATA_DIR, "fontcache.json")
+
+
+def _probe_font(names, test_char):
+    """Pfad des ersten installierten Fonts, der ``test_char`` rendert, sonst None."""
+    for name in names:
+        path = pygame.font.match_font(name)
+        if not path:
+            continue
+        try:
+            if pygame.font.Font(path, 22).render(test_char, True, (0, 0, 0)).get_width() > 0:
+                return path
+        except Exception:
+            pass
+    return None
+
+
+def resolve_font(names, test_char="🐔"):
+    """Font-Datei für ``pygame.font.Font`` (None = pygame-Standardfont), über Starts gemerkt."""
+    key = {"names": list(names), "pygame": pygame.version.ver}
+    try:
+        with open(FONT_CACHE, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        path = cached["path"]
+        if cached["key"] == key and path and os.path.exists(path):
+            return path
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    path = _probe_font(names, test_char)
+    if path is None:
+        return None  # nichts merken: beim nächsten Start erneut suchen
+    try:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        with open(FONT_CACHE, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "path": path}, f)
+    except OSError:
+        pass  # ohne Cache eben beim nächsten Start wieder suchen
+    return path
+
+
+class Preloader:
+    """Lädt Assets in einem Hintergrund-Thread; ``get`` wartet nur, wenn es noch nicht fertig ist.
+
+    Mit ``background=False`` wird erst beim ersten ``get`` geladen (im Hauptthread).
+    """
+
+    def __init__(self, background=True):
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="assets") if background else None
+        self._jobs = {}
+        self._done = {}
+        self.finished_at = None  # perf_counter, sobald alle Hintergrund-Jobs fertig sind
+
+    def submit(self, key, load, *args):
+        if self._pool is None:
+            self._jobs[key] = (load, args)
+        else:
+            future = self._jobs[key] = self._pool.submit(load, *args)
+            future.add_done_callback(self._check_finished)
+
+    def _check_finished(self, _):
+        if all(job.done() for job in list(self._jobs.values())):
+            self.finished_at = time.perf_counter()
+
+    def get(self, key):
+        if key not in self._done:
+            job = self._jobs[key]
+            self._done[key] = job[0](*job[1]) if self._pool is None else job.result()
+        return self._done[key]
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,236 @@
+"""Batch-Engine mit NumPy: N Spiele im Gleichschritt, Regeln wie engine.Game (benötigt numpy).
+
+Aufruf:  python batch.py [--games 10000] [--goals 128,256,512] [--size 6x6]
+         prüft die Übereinstimmung mit engine.Game und misst Spiele/s gegen die Einzel-Engine.
+
+Alle Bretter liegen in einem ``(N, W, H)``-int8-Array (-1 = leer wie
+``board.EMPTY``). Ein Schritt setzt N Paare auf einmal, findet 3er-Reihen über
+verschobene Vergleiche des ganzen Arrays und räumt sie; erlaubte Plätze sind
+Masken über den freien Zellen. Da vor jedem Setzen keine 3er-Reihe liegt (siehe
+``engine.place_on_board``), findet der Vollscan genau dieselben Treffer wie
+``matches_around``.
+
+Neue Paare kommen aus einem eigenen NumPy-Generator mit derselben Verteilung
+wie ``new_pair`` (Farben und Ausrichtung gleichverteilt); ein Seed ergibt also
+andere Spiele als in ``engine.Game``.
+"""
+import argparse
+import random
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # optional: nur dieses Skript braucht numpy, das Spiel nicht
+    sys.exit("batch.py braucht numpy (pip install numpy); nicht in requirements.txt.")
+
+from board import EMPTY
+from engine import CHICKEN_TYPES, GRID_W, GRID_H, Game, play, random_policy
+
+PLAYING, VICTORY, GAMEOVER = 0, 1, 2
+STATES = ("playing", "victory", "gameover")
+
+
+def match_mask(boards):
+    """Bool-Maske aller Zellen in waagrechten oder senkrechten Reihen von 3+ gleichen Hühnern."""
+    hit = np.zeros(boards.shape, dtype=bool)
+    filled = boards != EMPTY
+    # waagrecht (Achse 1 = x): jedes Fenster aus drei gleichen markiert alle drei Zellen
+    a, b, c = boards[:, :-2, :], boards[:, 1:-1, :], boards[:, 2:, :]
+    run = (a == b) & (b == c) & filled[:, :-2, :]
+    hit[:, :-2, :] |= run
+    hit[:, 1:-1, :] |= run
+    hit[:, 2:, :] |= run
+    # senkrecht (Achse 2 = y)
+    a, b, c = boards[:, :, :-2], boards[:, :, 1:-1], boards[:, :, 2:]
+    run = (a == b) & (b == c) & filled[:, :, :-2]
+    hit[:, :, :-2] |= run
+    hit[:, :, 1:-1] |= run
+    hit[:, :, 2:] |= run
+    return hit
+
+
+def legal_mask(boards, vertical):
+    """Maske der Ankerzellen (x, y), an denen das Paar mit Ausrichtung ``vertical`` passt."""
+    free = boards == EMPTY
+    h = np.zeros_like(free)
+    h[:, :-1, :] = free[:, :-1, :] & free[:, 1:, :]
+    v = np.zeros_like(free)
+    v[:, :, :-1] = free[:, :, :-1] & free[:, :, 1:]
+    return np.where(vertical[:, None, None], v, h)
+
+
+def pair_arrays(pair):
+    """``new_pair``-Ergebnis -> (Farben (c1, c2), senkrecht)."""
+    offsets, orientation = pair
+    return (offsets[0][2], offsets[1][2]), orientation == "v"
+
+
+class BatchGame:
+    """N Spiele gleicher Größe und gleichen Ziels als Arrays."""
+
+    def __init__(self, n, goal=256, width=GRID_W, height=GRID_H, seed=None):
+        self.n = n
+        self.goal = goal
+        self.width = width
+        self.height = height
+        self.rng = np.random.default_rng(seed)
+        self.boards = np.full((n, width, height), EMPTY, dtype=np.int8)
+        self.rescued = np.zeros(n, dtype=np.int64)
+        self.moves = np.zeros(n, dtype=np.int64)
+        self.state = np.full(n, PLAYING, dtype=np.int8)
+        self.cur_colors, self.cur_vertical = self.draw_pairs(n)
+        self.next_colors, self.next_vertical = self.draw_pairs(n)
+        self._legal = None  # erlaubte Plätze des aktuellen Paares, von step nachgeführt
+
+    def draw_pairs(self, n):
+        """n neue Paare: Farben (n, 2) und Ausrichtung (n,) wie ``new_pair``."""
+        colors = self.rng.integers(0, CHICKEN_TYPES, size=(n, 2), dtype=np.int8)
+        vertical = self.rng.integers(0, 2, size=n).astype(bool)
+        return colors, vertical
+
+    @classmethod
+    def from_games(cls, games):
+        """Übernimmt Brett, Paare und Stand laufender ``engine.Game``-Objekte (gleiche Größe, gleiches Ziel)."""
+        g0 = games[0]
+        batch = cls(len(games), g0.goal, g0.width, g0.height)
+        for i, g in enumerate(games):
+            for x in range(g.width):
+                for y in range(g.height):
+                    batch.boards[i, x, y] = g.board.get(x, y)
+            batch.rescued[i] = g.rescued
+            batch.moves[i] = g.moves
+            batch.state[i] = STATES.index(g.state)
+            batch.cur_colors[i], batch.cur_vertical[i] = pair_arrays(g.current_pair)
+            batch.next_colors[i], batch.next_vertical[i] = pair_arrays(g.next_pair)
+        batch._legal = None
+        return batch
+
+    @property
+    def active(self):
+        return self.state == PLAYING
+
+    def legal_mask(self):
+        """(N, W, H): erlaubte Plätze für das aktuelle Paar jedes Spiels."""
+        if self._legal is None:
+            self._legal = legal_mask(self.boards, self.cur_vertical)
+        return self._legal
+
+    def step(self, xs, ys, next_pairs=None, check=True):
+        """Setzt in jedem laufenden Spiel i das aktuelle Paar an (xs[i], ys[i]) und räumt Treffer.
+
+        Einträge fertiger Spiele werden ignoriert. ``next_pairs`` = (Farben, senkrecht)
+        der Länge N ersetzt das Ziehen neuer Paare (z.B. zum Abgleich mit engine.Game).
+        Gibt die Zahl der geräumten Hühner je Spiel zurück.
+        """
+        idx = np.flatnonzero(self.state == PLAYING)
+        cleared = np.zeros(self.n, dtype=np.int64)
+        if idx.size == 0:
+            return cleared
+        xs, ys = np.asarray(xs)[idx], np.asarray(ys)[idx]
+        boards = self.boards[idx]
+        vertical = self.cur_vertical[idx]
+        k = np.arange(idx.size)
+        if check and not legal_mask(boards, vertical)[k, xs, ys].all():
+            raise ValueError("unerlaubter Platz im Batch")
+
+        colors = self.cur_colors[idx]
+        boards[k, xs, ys] = colors[:, 0]
+        boards[k, xs + ~vertical, ys + vertical] = colors[:, 1]
+        hit = match_mask(boards)
+        n_hit = hit.sum(axis=(1, 2))
+        boards[hit] = EMPTY
+        self.boards[idx] = boards
+        self.rescued[idx] += n_hit
+        self.moves[idx] += 1
+        cleared[idx] = n_hit
+
+        # Paare weiterschieben
+        self.cur_colors[idx] = self.next_colors[idx]
+        self.cur_vertical[idx] = self.next_vertical[idx]
+        if next_pairs is None:
+            new_colors, new_vertical = self.draw_pairs(idx.size)
+        else:
+            new_colors, new_vertical = next_pairs[0][idx], next_pairs[1][idx]
+        self.next_colors[idx] = new_colors
+        self.next_vertical[idx] = new_vertical
+
+        legal = legal_mask(boards, self.cur_vertical[idx])
+        self.legal_mask()[idx] = legal  # für die nächste Zugwahl
+        won = self.rescued[idx] >= self.goal
+        stuck = ~legal.any(axis=(1, 2))
+        self.state[idx] = np.where(won, VICTORY, np.where(stuck, GAMEOVER, PLAYING))
+        return cleared
+
+    def random_moves(self):
+        """Ein gleichverteilt zufälliger erlaubter Platz je Spiel (wie ``random_policy``) als (xs, ys)."""
+        idx = np.flatnonzero(self.state == PLAYING)
+        mask = self.legal_mask()[idx].reshape(idx.size, -1)
+        scores = self.rng.random(mask.shape)
+        scores[~mask] = -1.0
+        flat = np.zeros(self.n, dtype=np.intp)
+        flat[idx] = scores.argmax(axis=1)
+        return flat // self.height, flat % self.height
+
+    def run(self, policy=None):
+        """Spielt alle Spiele zu Ende; ``policy(batch) -> (xs, ys)``, Standard zufällig."""
+        policy = policy or BatchGame.random_moves
+        while (self.state == PLAYING).any():
+            xs, ys = policy(self)
+            self.step(xs, ys, check=False)
+        return self
+
+
+def check_agreement(n, goal, width, height, seed=0):
+    """Spielt n Zufallsspiele parallel in engine.Game und im Batch und vergleicht jeden Schritt."""
+    games = [Game(goal, seed=seed + i, width=width, height=height) for i in range(n)]
+    rngs = [random.Random(seed + i) for i in range(n)]
+    batch = BatchGame.from_games(games)
+    while any(not g.over for g in games):
+        moves = [random_policy(g, rngs[i]) if not g.over else (0, 0) for i, g in enumerate(games)]
+        cleared = [len(g.place(*moves[i]) or ()) if not g.over else 0 for i, g in enumerate(games)]
+        xs = np.array([x for x, _ in moves], dtype=np.intp)
+        ys = np.array([y for _, y in moves], dtype=np.intp)
+        pairs = [pair_arrays(g.next_pair) for g in games]
+        next_pairs = (np.array([c for c, _ in pairs], dtype=np.int8), np.array([v for _, v in pairs]))
+        got = batch.step(xs, ys, next_pairs)
+        for i, g in enumerate(games):
+            assert got[i] == cleared[i], (i, got[i], cleared[i])
+            assert batch.rescued[i] == g.rescued and batch.moves[i] == g.moves
+            assert STATES[batch.state[i]] == g.state, (i, STATES[batch.state[i]], g.state)
+            assert all(batch.boards[i, x, y] == g.board.get(x, y)
+                       for x in range(width) for y in range(height))
+    return sum(g.moves for g in games)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--games", type=int, default=10000)
+    ap.add_argument("--goals", default="128,256,512")
+    ap.add_argument("--size", default=f"{GRID_W}x{GRID_H}")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+    w, h = (int(v) for v in args.size.lower().split("x"))
+    goals = [int(g) for g in args.goals.split(",")]
+
+    moves = check_agreement(300, goals[0], w, h, args.seed)
+    print(f"Batch stimmt mit engine.Game überein (300 Spiele, {moves} Züge).")
+
+    for goal in goals:
+        scalar_n = max(1, args.games // 20)
+        t = time.perf_counter()
+        for s in range(scalar_n):
+            rng = random.Random(s)
+            play(Game(goal, seed=s, width=w, height=h), lambda g: random_policy(g, rng))
+        scalar = scalar_n / (time.perf_counter() - t)
+
+        t = time.perf_counter()
+        batch = BatchGame(args.games, goal, w, h, seed=args.seed).run()
+        vec = args.games / (time.perf_counter() - t)
+        wins = (batch.state == VICTORY).mean()
+        print(f"Ziel {goal:>4}: Einzel {scalar:9,.0f} Spiele/s  Batch {vec:10,.0f} Spiele/s  "
+              f"(x{vec / scalar:.1f})  Gewinne {wins:.1%}  Züge {batch.moves.mean():.1f}")
+
+
+if __name__ == "__main__":
+    main()
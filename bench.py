@@ -0,0 +1,159 @@
+"""Benchmark der Brett-Backends (ListBoard vs. BitBoard).
+
+Aufruf:  python bench.py [--games 300] [--seed 0]
+
+Workloads:
+  * find/moves – find_matches + any_move_possible auf zufällig gefüllten Brettern
+  * simulation – komplette Zufallsspiele über engine.play
+  * solver     – gieriger 1-Zug-Löser: jede erlaubte Platzierung auf einer Kopie testen
+  * skalierung – Kosten pro Zug (Game.place) auf Brettern bis 256x256
+
+Vor dem Messen wird geprüft, dass beide Backends exakt dieselben Ergebnisse liefern.
+"""
+import argparse
+import random
+import time
+
+from board import BOARDS
+from engine import Game, CHICKEN_TYPES, GRID_W, GRID_H, default_board, play, random_policy
+
+
+def random_boards(n, seed, width=GRID_W, height=GRID_H, fill=0.6):
+    """n zufällige Bretter als Liste von Zellbelegungen {(x, y): c}."""
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        cells = {}
+        for x in range(width):
+            for y in range(height):
+                if rng.random() < fill:
+                    cells[(x, y)] = rng.randrange(CHICKEN_TYPES)
+        out.append(cells)
+    return out
+
+
+def build(kind, cells, width=GRID_W, height=GRID_H):
+    b = BOARDS[kind](width, height, CHICKEN_TYPES)
+    for (x, y), c in cells.items():
+        b.set(x, y, c)
+    return b
+
+
+PAIRS = [([(0,0,0), (1,0,0)], "h"), ([(0,0,0), (0,1,0)], "v")]
+
+
+def check_agreement(boards):
+    for cells in boards:
+        lb, bb = build("list", cells), build("bitboard", cells)
+        assert lb.find_matches() == bb.find_matches()
+        for offsets, _ in PAIRS:
+            assert lb.any_move_possible(offsets) == bb.any_move_possible(offsets)
+            assert lb.legal_moves(offsets) == bb.legal_moves(offsets)
+        for x in range(GRID_W):
+            for y in range(GRID_H):
+                assert lb.get(x, y) == bb.get(x, y)
+
+
+def bench_find(kind, boards, repeat=20):
+    built = [build(kind, cells) for cells in boards]
+    t = time.perf_counter()
+    for _ in range(repeat):
+        for b in built:
+            b.find_matches()
+            for offsets, _ in PAIRS:
+                b.any_move_possible(offsets)
+    return len(built) * repeat / (time.perf_counter() - t), "boards/s"
+
+
+def bench_simulation(kind, games, seed):
+    moves = 0
+    results = []
+    t = time.perf_counter()
+    for s in range(seed, seed + games):
+        rng = random.Random(s)
+        g = play(Game(goal=128, seed=s, board=kind), lambda g: random_policy(g, rng))
+        moves += g.moves
+        results.append((g.state, g.moves, g.rescued))
+    return moves / (time.perf_counter() - t), "moves/s", results
+
+
+def greedy_policy(game):
+    """Wählt die Platzierung mit den meisten sofort geräumten Hühnern."""
+    offsets = game.current_pair[0]
+    best, best_score = None, -1
+    for (x, y) in game.legal_moves():
+        b = game.board.copy()
+        for ox, oy, c in offsets:
+            b.set(x + ox, y + oy, c)
+        score = len(b.find_matches())
+        if score > best_score:
+            best, best_score = (x, y), score
+    return best
+
+
+def bench_solver(kind, games, seed):
+    moves = 0
+    results = []
+    t = time.perf_counter()
+    for s in range(seed, seed + games):
+        g = play(Game(goal=128, seed=s, board=kind), greedy_policy, max_moves=200)
+        moves += g.moves
+        results.append((g.state, g.moves, g.rescued))
+    return moves / (time.perf_counter() - t), "moves/s", results
+
+
+def bench_scaling(kind, size, moves=3000, seed=0):
+    """Mittlere Zeit pro Game.place in µs; Plätze werden zufällig gezogen."""
+    g = Game(goal=10**9, seed=seed, width=size, height=size, board=kind)
+    rng = random.Random(seed)
+    total, done = 0.0, 0
+    for _ in range(moves * 50):
+        if g.over or done >= moves:
+            break
+        x, y = rng.randrange(size), rng.randrange(size)
+        if g.can_place(x, y):
+            t = time.perf_counter()
+            g.place(x, y)
+            total += time.perf_counter() - t
+            done += 1
+    return total / max(done, 1) * 1e6
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--games", type=int, default=300)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    boards = random_boards(500, args.seed)
+    check_agreement(boards)
+    print("Backends stimmen überein (%d Bretter)." % len(boards))
+
+    workloads = [
+        ("find/moves", lambda k: bench_find(k, boards)),
+        ("simulation", lambda k: bench_simulation(k, args.games, args.seed)),
+        ("solver", lambda k: bench_solver(k, max(1, args.games // 10), args.seed)),
+    ]
+    for name, fn in workloads:
+        rates = {}
+        outcomes = []
+        for kind in BOARDS:
+            res = fn(kind)
+            rates[kind] = res[0]
+            unit = res[1]
+            if len(res) > 2:
+                outcomes.append(res[2])
+        if outcomes:
+            assert all(o == outcomes[0] for o in outcomes), f"{name}: Backends weichen ab"
+        base = rates["list"]
+        line = "  ".join(f"{k}: {r:10.0f} {unit}" for k, r in rates.items())
+        print(f"{name:<11} {line}  (x{rates['bitboard'] / base:.2f})")
+
+    print("skalierung  µs pro Zug:")
+    for size in (6, 16, 64, 256):
+        line = "  ".join(f"{k}: {bench_scaling(k, size):6.1f}" for k in BOARDS)
+        print(f"  {size:>3}x{size:<3}  {line}  (Standard: {default_board(size, size)})")
+
+
+if __name__ == "__main__":
+    main()
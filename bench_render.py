@@ -0,0 +1,189 @@
+"""Render-Messung ohne Fenster (SDL-Dummy-Treiber).
+
+Aufruf:  python bench_render.py [--frames 600] [--board 6]
+
+Zeichnet das Spielbrett samt roter Vorschau wie draw_game/draw_chicken in
+main.py, einmal im alten Stil (``img.copy()`` pro Kachel und Frame) und einmal
+über den Sprite-Cache, und gibt Surface-Allokationen und Frame-Zeit aus.
+Dazu eine große Räum-Kaskade: Pop-Effekte mit rotozoom pro Frame und
+``list.remove`` gegen Einzelbild-Atlas + Effekt-Pool.
+
+Der neue Pfad ist der Code des Spiels (``sprites.blend``/``sprites.pop_atlas``);
+die Hühnerbilder kommen aus ``assets/`` neben diesem Skript, ohne sie bricht
+die Messung ab.
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import argparse
+import random
+import sys
+import time
+
+import pygame
+
+from engine import Game, CHICKEN_TYPES, play, random_policy
+from render_cache import LRUCache
+from effects import EffectPool, POP_DURATION, frame_index, pop_transform
+from sprites import blend, pop_atlas
+
+ASSET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+
+TILE_SIZE = 72
+PADDING = 20
+RED = (220, 60, 60)
+
+
+class Allocs:
+    """Zählt erzeugte Surfaces im jeweiligen Zeichenpfad."""
+    count = 0
+
+
+def load_images(size):
+    imgs = []
+    for i in range(CHICKEN_TYPES):
+        path = os.path.join(ASSET_DIR, f"chicken{i}.png")
+        try:
+            img = pygame.image.load(path).convert_alpha()
+        except (pygame.error, FileNotFoundError) as e:
+            # Ersatzflächen würden andere Zahlen liefern als die echten Sprites
+            sys.exit(f"bench_render.py: Hühnerbild fehlt ({path}: {e})")
+        imgs.append(pygame.transform.smoothscale(img, (size, size)))
+    return imgs
+
+
+# --- alter Pfad (Stand vor dem Sprite-Cache) ---
+def draw_chicken_legacy(screen, imgs, rect, chicken_id, alpha=255, tint=None):
+    if chicken_id < 0:
+        pygame.draw.rect(screen, (60,65,80), rect, border_radius=12)
+        return
+    img = imgs[chicken_id]
+    if tint:
+        temp = img.copy()
+        tint_surf = pygame.Surface(temp.get_size(), pygame.SRCALPHA)
+        Allocs.count += 2
+        tint_surf.fill((*tint, alpha))
+        temp.blit(tint_surf, (0,0), special_flags=pygame.BLEND_RGBA_MULT)
+        temp.set_alpha(255 if alpha >= 255 else alpha)
+        screen.blit(temp, rect)
+    else:
+        tmp = img.copy()
+        Allocs.count += 1
+        tmp.set_alpha(alpha)
+        screen.blit(tmp, rect)
+
+
+# --- neuer Pfad (main.chicken_sprite: LRU-Cache über sprites.blend) ---
+def make_cached(imgs):
+    cache = LRUCache(maxsize=64)
+
+    def build(chicken_id, alpha, tint):
+        img = imgs[chicken_id]
+        sprite = blend(img, alpha, tint)
+        if sprite is not img:
+            Allocs.count += 2 if tint else 1  # Kopie (+ Farbfläche)
+        return sprite
+
+    def draw(screen, imgs, rect, chicken_id, alpha=255, tint=None):
+        if chicken_id < 0:
+            pygame.draw.rect(screen, (60,65,80), rect, border_radius=12)
+            return
+        screen.blit(cache.get((chicken_id, alpha, tint), lambda: build(chicken_id, alpha, tint)), rect)
+
+    return draw, cache
+
+
+def run(draw, screen, imgs, game, frames):
+    rng = random.Random(1)
+    size = TILE_SIZE - 4
+    w, h = game.width, game.height
+    Allocs.count = 0
+    t = time.perf_counter()
+    for _ in range(frames):
+        screen.fill((30, 30, 40))
+        for x in range(w):
+            for y in range(h):
+                rect = pygame.Rect(PADDING + x*TILE_SIZE, PADDING + y*TILE_SIZE, size, size)
+                draw(screen, imgs, rect, game.board.get(x, y))
+        # Vorschau unter einer wandernden Maus: mal gültig, mal rot
+        gx, gy = rng.randrange(w - 1), rng.randrange(h - 1)
+        valid = game.can_place(gx, gy)
+        for ox, oy, c in game.current_pair[0]:
+            rect = pygame.Rect(PADDING + (gx+ox)*TILE_SIZE, PADDING + (gy+oy)*TILE_SIZE, size, size)
+            draw(screen, imgs, rect, c, alpha=140 if valid else 180, tint=None if valid else RED)
+    elapsed = time.perf_counter() - t
+    return elapsed / frames * 1000, Allocs.count / frames
+
+
+def cascade_legacy(screen, imgs, cells, dt=16):
+    """Pop-Effekte wie vor dem Atlas: Dict + rotozoom pro Effekt und Frame."""
+    effects = [{"x": x, "y": y, "img": imgs[c].copy(), "t": 0.0} for x, y, c in cells]
+    worst = 0.0
+    while effects:
+        t0 = time.perf_counter()
+        remove_list = []
+        for eff in effects:
+            eff["t"] += dt / POP_DURATION
+            t = eff["t"]
+            if t >= 1.0:
+                remove_list.append(eff)
+                continue
+            scale, alpha, angle = pop_transform(t)
+            img = pygame.transform.rotozoom(eff["img"], angle, scale)
+            img.set_alpha(alpha)
+            screen.blit(img, img.get_rect(center=(PADDING + eff["x"] * 4, PADDING + eff["y"] * 4)))
+        for eff in remove_list:
+            effects.remove(eff)
+        worst = max(worst, time.perf_counter() - t0)
+    return worst * 1000
+
+
+def cascade_pooled(screen, imgs, cells, dt=16):
+    """Pop-Effekte wie main.draw_pop_effects: Pool + Atlas aus ``sprites.pop_atlas``."""
+    atlas = {c: pop_atlas(img) for c, img in enumerate(imgs)}
+    pool = EffectPool(capacity=len(cells))
+    for x, y, c in cells:
+        pool.spawn(x, y, c, TILE_SIZE - 4)
+    worst = 0.0
+    while len(pool):
+        t0 = time.perf_counter()
+        pool.update(dt)
+        for eff in pool:
+            img = atlas[eff.c][frame_index(eff.t)]
+            screen.blit(img, img.get_rect(center=(PADDING + eff.x * 4, PADDING + eff.y * 4)))
+        worst = max(worst, time.perf_counter() - t0)
+    return worst * 1000
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--frames", type=int, default=600)
+    ap.add_argument("--board", type=int, default=6)
+    args = ap.parse_args()
+
+    pygame.init()
+    n = args.board
+    screen = pygame.display.set_mode((n * TILE_SIZE + 2 * PADDING, n * TILE_SIZE + 2 * PADDING))
+    imgs = load_images(TILE_SIZE - 4)
+
+    # halb volles Brett aus einem echten Spielverlauf
+    game = play(Game(goal=10**9, seed=3, width=n, height=n),
+                lambda g, r=random.Random(3): random_policy(g, r), max_moves=n * n // 4)
+
+    draw_cached, cache = make_cached(imgs)
+    for name, draw in (("copy/Frame", draw_chicken_legacy), ("Sprite-Cache", draw_cached)):
+        ms, allocs = run(draw, screen, imgs, game, args.frames)
+        print(f"{name:<13} {ms:6.3f} ms/Frame  {allocs:7.2f} Surfaces/Frame")
+    print("Cache:", cache.stats())
+
+    # Kaskade: 1000 gleichzeitig geräumte Hühner (z.B. lange Reihen auf einem Mega-Board)
+    rng = random.Random(2)
+    cells = [(rng.randrange(100), rng.randrange(100), rng.randrange(CHICKEN_TYPES)) for _ in range(1000)]
+    print(f"Kaskade {len(cells)} Effekte, schlechtester Frame:")
+    print(f"  rotozoom/Frame  {cascade_legacy(screen, imgs, cells):8.2f} ms")
+    print(f"  Atlas + Pool    {cascade_pooled(screen, imgs, cells):8.2f} ms")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+"""Brett-Backends für die Engine.
+
+Beide Klassen haben dieselbe Schnittstelle und liefern exakt dieselben Ergebnisse:
+
+* ``ListBoard`` – das klassische ``grid[x][y]`` als verschachtelte Liste.
+* ``BitBoard``  – eine Integer-Bitmaske pro Hühnertyp plus Belegungsmaske.
+  Treffer (3+ in Reihe) per Shift-und-AND, freie Paar-Plätze über
+  vorberechnete Platzierungsmasken.
+"""
+
+EMPTY = -1
+
+
+def pair_kind(offsets):
+    """'h' / 'v' für die beiden Paar-Formen aus ``new_pair``, sonst None."""
+    if len(offsets) == 2 and offsets[0][:2] == (0, 0):
+        d = offsets[1][:2]
+        if d == (1, 0): return "h"
+        if d == (0, 1): return "v"
+    return None
+
+
+class SlotIndex:
+    """Index der freien Zellen und Zähler der freien waagrechten/senkrechten Paar-Plätze.
+
+    Wird bei jedem Setzen/Räumen einer Zelle lokal nachgeführt (nur die bis zu
+    vier Plätze, die diese Zelle berühren). "Passt ein Paar noch irgendwo hin?"
+    ist damit ein Blick auf einen Zähler statt einer Suche über das ganze Brett.
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.free = bytearray([1]) * (width * height)
+        self.h = (width - 1) * height
+        self.v = width * (height - 1)
+
+    def copy(self):
+        other = SlotIndex.__new__(SlotIndex)
+        other.width, other.height = self.width, self.height
+        other.free = bytearray(self.free)
+        other.h, other.v = self.h, self.v
+        return other
+
+    def _neighbours(self, x, y, i):
+        """Anzahl freier Nachbarn waagrecht / senkrecht."""
+        free, h = self.free, self.height
+        nh = (x > 0 and free[i-h]) + (x < self.width-1 and free[i+h])
+        nv = (y > 0 and free[i-1]) + (y < h-1 and free[i+1])
+        return nh, nv
+
+    def fill(self, x, y):
+        i = x * self.height + y
+        if not self.free[i]:
+            return
+        nh, nv = self._neighbours(x, y, i)
+        self.h -= nh
+        self.v -= nv
+        self.free[i] = 0
+
+    def release(self, x, y):
+        i = x * self.height + y
+        if self.free[i]:
+            return
+        nh, nv = self._neighbours(x, y, i)
+        self.h += nh
+        self.v += nv
+        self.free[i] = 1
+
+    def fits(self, x, y, offsets):
+        w, h, free = self.width, self.height, self.free
+        for ox, oy, _ in offsets:
+            tx, ty = x + ox, y + oy
+            if tx < 0 or tx >= w or ty < 0 or ty >= h: return False
+            if not free[tx * h + ty]: return False
+        return True
+
+    def any_fit(self, offsets):
+        """True/False über die Zähler, None wenn die Form nicht indiziert ist."""
+        kind = pair_kind(offsets)
+        if kind == "h": return self.h > 0
+        if kind == "v": return self.v > 0
+        return None
+
+
+class ListBoard:
+    """Brett als verschachtelte Liste, ``grid[x][y]`` (-1 = leer)."""
+
+    def __init__(self, width, height, types=4):
+        self.width = width
+        self.height = height
+        self.types = types
+        self.grid = [[EMPTY for _ in range(height)] for _ in range(width)]
+        self.slots = SlotIndex(width, height)
+
+    def copy(self):
+        other = ListBoard.__new__(ListBoard)
+        other.width, other.height, other.types = self.width, self.height, self.types
+        other.grid = [col[:] for col in self.grid]
+        other.slots = self.slots.copy()
+        return other
+
+    def get(self, x, y):
+        return self.grid[x][y]
+
+    def key(self):
+        """Kompakter, hashbarer Schlüssel des Inhalts (für Transpositionstabellen)."""
+        return bytes(c + 1 for col in self.grid for c in col)
+
+    def set(self, x, y, c):
+        self.grid[x][y] = c
+        self.slots.fill(x, y)
+
+    def clear(self, x, y):
+        self.grid[x][y] = EMPTY
+        self.slots.release(x, y)
+
+    def can_place(self, x, y, offsets):
+        return self.slots.fits(x, y, offsets)
+
+    def find_matches(self):
+        grid = self.grid
+        w, h = self.width, self.height
+        matches = set()
+        # horizontal
+        for y in range(h):
+            run_len = 1
+            for x in range(1, w+1):
+                if x < w and grid[x][y] != EMPTY and grid[x][y] == grid[x-1][y]:
+                    run_len += 1
+                else:
+                    if run_len >= 3:
+                        for k in range(run_len):
+                            matches.add((x-1-k, y))
+                    run_len = 1
+        # vertikal
+        for x in range(w):
+            run_len = 1
+            for y in range(1, h+1):
+                if y < h and grid[x][y] != EMPTY and grid[x][y] == grid[x][y-1]:
+                    run_len += 1
+                else:
+                    if run_len >= 3:
+                        for k in range(run_len):
+                            matches.add((x, y-1-k))
+                    run_len = 1
+        return matches
+
+    def matches_around(self, cells):
+        """Treffer nur in den Zeilen/Spalten durch ``cells`` (siehe Game.place_pair)."""
+        grid = self.grid
+        w, h = self.width, self.height
+        matches = set()
+        for x, y in cells:
+            c = grid[x][y]
+            if c == EMPTY:
+                continue
+            # horizontal
+            lo, hi = x, x
+            while lo > 0 and grid[lo-1][y] == c: lo -= 1
+            while hi < w-1 and grid[hi+1][y] == c: hi += 1
+            if hi - lo >= 2:
+                matches.update((k, y) for k in range(lo, hi+1))
+            # vertikal
+            lo, hi = y, y
+            col = grid[x]
+            while lo > 0 and col[lo-1] == c: lo -= 1
+            while hi < h-1 and col[hi+1] == c: hi += 1
+            if hi - lo >= 2:
+                matches.update((x, k) for k in range(lo, hi+1))
+        return matches
+
+    def any_move_possible(self, offsets):
+        fit = self.slots.any_fit(offsets)
+        if fit is not None:
+            return fit
+        for x in range(self.width):
+            for y in range(self.height):
+                if self.can_place(x, y, offsets):
+                    return True
+        return False
+
+    def legal_moves(self, offsets):
+        return [(x, y) for x in range(self.width) for y in range(self.height)
+                if self.can_place(x, y, offsets)]
+
+
+class BitBoard:
+    """Brett als Bitmasken.
+
+    Layout spaltenweise: Bit ``x * stride + y`` mit ``stride = height + 1``.
+    Das zusätzliche Bit pro Spalte ist ein Wächter (immer 0), damit vertikale
+    Shifts nicht in die nächste Spalte überlaufen. Die Bitreihenfolge entspricht
+    damit der ``for x: for y:``-Reihenfolge des ``ListBoard``.
+    """
+
+    def __init__(self, width, height, types=4):
+        self.width = width
+        self.height = height
+        self.types = types
+        self.stride = height + 1
+        self.masks = [0] * types
+        self.occ = 0
+        # alle gültigen Zellen (ohne Wächterbits)
+        column = (1 << height) - 1
+        full = 0
+        for x in range(width):
+            full |= column << (x * self.stride)
+        self.full = full
+        self.slots = SlotIndex(width, height)
+
+    def copy(self):
+        other = BitBoard.__new__(BitBoard)
+        other.__dict__.update(self.__dict__)
+        other.masks = self.masks[:]
+        other.slots = self.slots.copy()
+        return other
+
+    def key(self):
+        return tuple(self.masks)
+
+    def load(self, key):
+        """Gegenstück zu ``key``: übernimmt die Masken und baut Belegung und SlotIndex neu auf."""
+        self.masks = list(key)
+        occ = 0
+        for m in key:
+            occ |= m
+        self.occ = occ
+        slots, s, h = self.slots, self.stride, self.height
+        free = slots.free
+        for x in range(self.width):
+            column = occ >> (x * s)
+            for y in range(h):
+                free[x * h + y] = not column >> y & 1
+        slots.h = bin(self.slot_mask(((0, 0, 0), (1, 0, 0)))).count("1")
+        slots.v = bin(self.slot_mask(((0, 0, 0), (0, 1, 0)))).count("1")
+
+    def get(self, x, y):
+        bit = 1 << (x * self.stride + y)
+        if not self.occ & bit:
+            return EMPTY
+        for c, m in enumerate(self.masks):
+            if m & bit:
+                return c
+        return EMPTY
+
+    def set(self, x, y, c):
+        bit = 1 << (x * self.stride + y)
+        if self.occ & bit:
+            self.clear(x, y)
+        self.masks[c] |= bit
+        self.occ |= bit
+        self.slots.fill(x, y)
+
+    def clear(self, x, y):
+        c = self.get(x, y)
+        if c == EMPTY:
+            return
+        keep = ~(1 << (x * self.stride + y))
+        self.masks[c] &= keep
+        self.occ &= keep
+        self.slots.release(x, y)
+
+    def _cells(self, mask):
+        """Zerlegt eine Maske in (x, y)-Koordinaten (aufsteigende Bitreihenfolge)."""
+        stride = self.stride
+        out = []
+        while mask:
+            low = mask & -mask
+            i = low.bit_length() - 1
+            out.append((i // stride, i % stride))
+            mask ^= low
+        return out
+
+    def match_mask(self):
+        """Alle Zellen in einer Reihe von 3+ gleichen Hühnern als Maske."""
+        s = self.stride
+        hit = 0
+        for m in self.masks:
+            if not m:
+                continue
+            # vertikal (Nachbar = Shift um 1), horizontal (Nachbar = Shift um stride)
+            v = m & (m >> 1) & (m >> 2)
+            h = m & (m >> s) & (m >> 2*s)
+            hit |= v | (v << 1) | (v << 2) | h | (h << s) | (h << 2*s)
+        return hit
+
+    def find_matches(self):
+        return set(self._cells(self.match_mask()))
+
+    def matches_around(self, cells):
+        """Wie ``find_matches``, aber nur entlang der Linien durch ``cells``."""
+        s = self.stride
+        hit = 0
+        for x, y in cells:
+            i = x * s + y
+            c = self.get(x, y)
+            if c == EMPTY:
+                continue
+            m = self.masks[c]
+            # vertikal: Schritt 1, Wächterbits beenden den Lauf an den Spaltengrenzen
+            lo, hi = i, i
+            while lo > 0 and m >> (lo-1) & 1: lo -= 1
+            while m >> (hi+1) & 1: hi += 1
+            if hi - lo >= 2:
+                hit |= ((1 << (hi - lo + 1)) - 1) << lo
+            # horizontal: Schritt stride
+            lo, hi = i, i
+            while lo >= s and m >> (lo-s) & 1: lo -= s
+            while m >> (hi+s) & 1: hi += s
+            if hi - lo >= 2*s:
+                for k in range(lo, hi+1, s):
+                    hit |= 1 << k
+        return set(self._cells(hit))
+
+    def slot_mask(self, offsets):
+        """Maske aller Ankerzellen, an denen ``offsets`` komplett auf freie Zellen fällt."""
+        s = self.stride
+        free = self.full & ~self.occ
+        slots = free
+        for ox, oy, _ in offsets:
+            shift = ox * s + oy
+            slots &= (free >> shift) if shift >= 0 else (free << -shift)
+        return slots
+
+    def can_place(self, x, y, offsets):
+        return self.slots.fits(x, y, offsets)
+
+    def any_move_possible(self, offsets):
+        fit = self.slots.any_fit(offsets)
+        if fit is not None:
+            return fit
+        return self.slot_mask(offsets) != 0
+
+    def legal_moves(self, offsets):
+        return self._cells(self.slot_mask(offsets))
+
+
+BOARDS = {"list": ListBoard, "bitboard": BitBoard}
@@ -0,0 +1,146 @@
+"""Bots für Sort the CHICKENS! und ein Turnier über viele Seeds in mehreren Prozessen.
+
+Aufruf:
+  python bots.py [--policies random,greedy,lookahead] [--goals 128,256,512]
+                 [--seeds 1000] [--procs N] [--size 6x6]
+
+Eine Policy ist wie in ``engine.play`` eine Funktion ``policy(game) -> (x, y)``.
+``make_policy`` baut sie mit eigenem Zufallsgenerator, damit jedes Spiel
+(Seed der Paare + Seed des Bots) reproduzierbar ist.
+
+- random:    irgendein erlaubter Platz
+- greedy:    der Platz, der sofort die meisten Hühner räumt
+- lookahead: aktuelles und nächstes Paar zusammen; Züge, nach denen das
+             nächste Paar nicht mehr passt, werden gemieden
+
+Ausgabe je Policy und Ziel: Gewinnquote, mittlere Züge und Spiele/s pro Kern
+(Spiele durch CPU-Zeit der Worker), dazu die Gesamtzeit.
+"""
+import argparse
+import multiprocessing as mp
+import os
+import random
+import time
+
+from engine import Game, GRID_W, GRID_H, place_on_board, play, random_policy, undo
+
+LOST = -10**6  # Bewertung für Züge, nach denen nichts mehr passt
+
+
+def try_place(board, x, y, offsets):
+    """Wie viele Hühner ein Zug räumen würde; das Brett bleibt unverändert."""
+    cleared = place_on_board(board, x, y, offsets)
+    undo(board, x, y, offsets, cleared)
+    return len(cleared)
+
+
+def best_moves(scored):
+    """Alle Züge mit der höchsten Bewertung aus [(bewertung, zug)]."""
+    top = max(s for s, _ in scored)
+    return [m for s, m in scored if s == top]
+
+
+def greedy_policy(game, rng=random):
+    offsets = game.current_pair[0]
+    board = game.board
+    scored = [(try_place(board, x, y, offsets), (x, y)) for x, y in game.legal_moves()]
+    return rng.choice(best_moves(scored))
+
+
+def lookahead_policy(game, rng=random):
+    """Bewertet jeden Zug mit dem eigenen Gewinn plus dem besten Gewinn des nächsten Paares."""
+    board = game.board
+    offsets, next_offsets = game.current_pair[0], game.next_pair[0]
+    need = game.goal - game.rescued
+    scored = []
+    for x, y in game.legal_moves():
+        cleared = place_on_board(board, x, y, offsets)
+        gain = len(cleared)
+        if gain >= need:
+            score = gain  # gewonnen, das nächste Paar ist egal
+        else:
+            follow = [try_place(board, nx, ny, next_offsets) for nx, ny in board.legal_moves(next_offsets)]
+            score = gain + max(follow) if follow else LOST
+        undo(board, x, y, offsets, cleared)
+        scored.append((score, (x, y)))
+    return rng.choice(best_moves(scored))
+
+
+POLICIES = {
+    "random": random_policy,
+    "greedy": greedy_policy,
+    "lookahead": lookahead_policy,
+}
+
+
+def make_policy(name, seed):
+    # eigener Strom je Policy, nicht derselbe wie ``Game.rng`` mit gleichem Seed
+    base, rng = POLICIES[name], random.Random(f"{name}:{seed}")
+    return lambda game: base(game, rng)
+
+
+def run_games(job):
+    """Spielt einen Seed-Block mit einer Policy; (Policy, Ziel, gewonnen, Züge gesamt, Spiele, CPU-Sekunden)."""
+    name, goal, seeds, width, height = job
+    t = time.process_time()
+    wins = moves = 0
+    for seed in seeds:
+        game = play(Game(goal, seed=seed, width=width, height=height), make_policy(name, seed))
+        wins += game.state == "victory"
+        moves += game.moves
+    return name, goal, wins, moves, len(seeds), time.process_time() - t
+
+
+def tournament(policies, goals, n_seeds, procs, width, height, chunk=25):
+    """Verteilt (Policy, Ziel, Seed-Block) auf einen Prozess-Pool; Ergebnis je (Policy, Ziel).
+
+    Kleine Blöcke, einzeln vergeben: teure Policies blockieren so keinen Worker
+    lange, und alle Kerne bleiben bis zum Schluss beschäftigt.
+    """
+    jobs = [(name, goal, range(start, min(start + chunk, n_seeds)), width, height)
+            for name in policies for goal in goals for start in range(0, n_seeds, chunk)]
+    results = {(name, goal): [0, 0, 0, 0.0] for name in policies for goal in goals}
+    with mp.get_context("spawn").Pool(procs) as pool:
+        for name, goal, *res in pool.imap_unordered(run_games, jobs, chunksize=1):
+            acc = results[(name, goal)]
+            for i, v in enumerate(res):
+                acc[i] += v
+    return results
+
+
+def usable_cpus():
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--policies", default="random,greedy,lookahead")
+    ap.add_argument("--goals", default="128,256,512")
+    ap.add_argument("--seeds", type=int, default=1000, help="Spiele pro Policy und Ziel")
+    ap.add_argument("--procs", type=int, default=usable_cpus())
+    ap.add_argument("--size", default=f"{GRID_W}x{GRID_H}")
+    args = ap.parse_args()
+    policies = args.policies.split(",")
+    for name in policies:
+        if name not in POLICIES:
+            ap.error(f"unbekannte Policy '{name}' (bekannt: {', '.join(POLICIES)})")
+    goals = [int(g) for g in args.goals.split(",")]
+    w, h = (int(v) for v in args.size.lower().split("x"))
+
+    t = time.perf_counter()
+    results = tournament(policies, goals, args.seeds, args.procs, w, h)
+    elapsed = time.perf_counter() - t
+
+    print(f"{'Policy':<10} {'Ziel':>5} {'Gewinne':>8} {'Züge':>8} {'Spiele/s/Kern':>14}")
+    cpu_total = 0.0
+    for (name, goal), (wins, moves, games, cpu) in results.items():
+        cpu_total += cpu
+        print(f"{name:<10} {goal:>5} {wins / games:>7.1%} {moves / games:>8.1f} {games / max(cpu, 1e-9):>14,.0f}")
+    print(f"{args.procs} Prozesse, {elapsed:.1f}s Wandzeit, {cpu_total:.1f}s CPU "
+          f"(Auslastung {cpu_total / elapsed / args.procs:.0%})")
+
+
+if __name__ == "__main__":
+    main()
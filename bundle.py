@@ -0,0 +1,143 @@
+"""Vorgebackenes Asset-Bündel: fertig skalierte Rohpixel und ein Index in einer Datei.
+
+Erzeugen (einmal pro Build, z.B. vor PyInstaller):
+  python bundle.py [--screen 712x572] [--out assets/assets.bundle]
+
+Aufbau: ``MAGIC``, Indexlänge (4 Byte, little endian), Index als JSON, danach
+ab der nächsten ``ALIGN``-Grenze die Pixelblöcke, je auf ``ALIGN`` Bytes
+ausgerichtet. Der Index ordnet ``"<pfad>@<b>x<h>"`` (bzw. nur ``"<pfad>"`` für
+Bilder in Originalgröße) Offset ab Datenbeginn, Länge, Größe und Format (RGB/RGBA) zu.
+
+Das Spiel mappt die Datei per mmap und legt Surfaces direkt auf die Pixel,
+ohne PNG-Dekodieren und smoothscale. Fehlt das Bündel oder eine Größe, werden
+die losen Dateien geladen.
+"""
+import argparse
+import json
+import mmap
+import os
+import struct
+
+import pygame
+
+from engine import CHICKEN_TYPES
+from viewport import ZOOM_LEVELS, inner_size
+
+MAGIC = b"CHKBNDL1"
+ALIGN = 64
+BUNDLE_FILE = "assets/assets.bundle"
+
+
+def _data_start(header_len):
+    n = len(MAGIC) + 4 + header_len
+    return n + (-n % ALIGN)
+
+
+def bundle_key(relpath, size=None):
+    return relpath if size is None else f"{relpath}@{size[0]}x{size[1]}"
+
+
+class AssetBundle:
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        try:
+            # Copy-on-Write: frombuffer bekommt einen beschreibbaren Puffer, gelesen
+            # wird trotzdem direkt aus dem Seiten-Cache
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_COPY)
+            if self._map[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{path} ist kein Asset-Bündel")
+            (n,) = struct.unpack_from("<I", self._map, len(MAGIC))
+            start = len(MAGIC) + 4
+            self.index = json.loads(self._map[start:start + n].decode("utf-8"))
+            self._base = _data_start(n)
+        except Exception:
+            self._file.close()
+            raise
+
+    @classmethod
+    def open(cls, path):
+        """Bündel oder None, wenn es fehlt oder unlesbar ist (dann gelten die losen Dateien)."""
+        try:
+            return cls(path)
+        except (OSError, ValueError) as e:
+            if not isinstance(e, FileNotFoundError):
+                print(f"Warnung: Asset-Bündel nicht nutzbar ({e}), lade einzelne Dateien.")
+            return None
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def surface(self, relpath, size=None):
+        """Surface auf den gemappten Pixeln (ohne Kopie) oder None, wenn nicht enthalten.
+
+        Noch nicht ins Anzeigeformat gewandelt; dafür ``convert``/``convert_alpha``.
+        """
+        e = self.index.get(bundle_key(relpath, size))
+        if e is None:
+            return None
+        offset = self._base + e["offset"]
+        view = memoryview(self._map)[offset:offset + e["length"]]
+        return pygame.image.frombuffer(view, tuple(e["size"]), e["format"])
+
+
+def default_spec(screen_size):
+    """(pfad, größe, alpha) aller Bilder, wie main.py sie braucht."""
+    spec = [("assets/BG.png", screen_size, False),
+            ("assets/chickensleep.png", None, True),
+            ("assets/chickensleep1.png", None, True)]
+    for i in range(CHICKEN_TYPES):
+        for tile in ZOOM_LEVELS:
+            n = inner_size(tile)
+            spec.append((f"assets/chicken{i}.png", (n, n), True))
+    return spec
+
+
+def build_bundle(out, spec, root="."):
+    """Dekodiert und skaliert jedes Bild wie im Spiel und schreibt Rohpixel + Index."""
+    index = {}
+    blobs = []
+    offset = 0
+    for relpath, size, alpha in spec:
+        img = pygame.image.load(os.path.join(root, relpath))
+        img = img.convert_alpha() if alpha else img.convert()
+        if size is not None and img.get_size() != tuple(size):
+            img = pygame.transform.smoothscale(img, size)
+        fmt = "RGBA" if alpha else "RGB"
+        data = pygame.image.tostring(img, fmt)
+        index[bundle_key(relpath, size)] = {
+            "offset": offset, "length": len(data), "size": list(img.get_size()), "format": fmt}
+        pad = -len(data) % ALIGN
+        blobs.append(data + b"\0" * pad)
+        offset += len(data) + pad
+
+    header = json.dumps(index, sort_keys=True).encode("utf-8")
+    tmp = out + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        f.write(b"\0" * (_data_start(len(header)) - f.tell()))
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp, out)
+    return index
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--screen", default="712x572", help="Fenstergröße wie SCREEN_W x SCREEN_H in main.py")
+    ap.add_argument("--out", default=BUNDLE_FILE)
+    args = ap.parse_args()
+    w, h = (int(v) for v in args.screen.lower().split("x"))
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))  # convert/convert_alpha brauchen ein Anzeigeformat
+    index = build_bundle(args.out, default_spec((w, h)))
+    total = os.path.getsize(args.out)
+    print(f"{args.out}: {len(index)} Bilder, {total / 1024:.0f} KiB")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
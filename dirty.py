@@ -0,0 +1,73 @@
+"""Sammelt geänderte Bildschirmbereiche (Dirty Rects) für Teil-Updates (ohne pygame).
+
+Rechtecke sind ``(x, y, w, h)``-Tupel; ``pygame.Rect`` wird ebenso angenommen.
+Wird zu viel Fläche schmutzig, lohnt ein Teil-Update nicht mehr und der Frame
+wird komplett neu gezeichnet.
+"""
+
+
+def _union(a, b):
+    x = min(a[0], b[0])
+    y = min(a[1], b[1])
+    return (x, y, max(a[0] + a[2], b[0] + b[2]) - x, max(a[1] + a[3], b[1] + b[3]) - y)
+
+
+def _overlap(a, b):
+    return a[0] < b[0] + b[2] and b[0] < a[0] + a[2] and a[1] < b[1] + b[3] and b[1] < a[1] + a[3]
+
+
+class DirtyRects:
+    def __init__(self, width, height, full_ratio=0.6):
+        self.width = width
+        self.height = height
+        self.full_ratio = full_ratio  # ab diesem Flächenanteil lieber alles zeichnen
+        self.rects = []
+        self.full = True  # der erste Frame ist immer komplett
+
+    def mark_full(self):
+        self.full = True
+
+    def add(self, rect):
+        x, y, w, h = rect
+        # auf den Bildschirm beschneiden
+        x2, y2 = min(x + w, self.width), min(y + h, self.height)
+        x, y = max(x, 0), max(y, 0)
+        if x2 > x and y2 > y:
+            self.rects.append((x, y, x2 - x, y2 - y))
+
+    def _merged(self):
+        """Überlappende Rechtecke zusammenfassen, bis keine mehr überlappen."""
+        rects = self.rects
+        merged = True
+        while merged and len(rects) > 1:
+            merged = False
+            out = []
+            for r in rects:
+                for i, o in enumerate(out):
+                    if _overlap(r, o):
+                        out[i] = _union(r, o)
+                        merged = True
+                        break
+                else:
+                    out.append(r)
+            rects = out
+        return rects
+
+    def take(self):
+        """(full, rects) für diesen Frame; setzt den Sammler zurück."""
+        full, rects = self.full, self._merged()
+        self.full = False
+        self.rects = []
+        if not full and sum(w * h for _, _, w, h in rects) > self.full_ratio * self.width * self.height:
+            full = True
+        return full, ([] if full else rects)
+
+    @staticmethod
+    def bounds(rects):
+        """Umschließendes Rechteck einer Liste (oder None)."""
+        if not rects:
+            return None
+        out = rects[0]
+        for r in rects[1:]:
+            out = _union(out, r)
+        return out
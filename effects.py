@@ -0,0 +1,73 @@
+"""Pop-Effekte beim Räumen: fester Objekt-Pool statt Dict pro Huhn (ohne pygame).
+
+Die eigentlichen Bilder liegen vorberechnet in einem Atlas (siehe
+``sprites.pop_atlas``); ein Effekt merkt sich nur Zelle, Huhn und
+Fortschritt ``t`` und wählt daraus das Einzelbild.
+"""
+
+POP_DURATION = 220.0  # ms, Animation dauert ca. 0.22s
+POP_FRAMES = 12       # Anzahl vorberechneter Einzelbilder pro Huhn
+
+
+def pop_transform(t):
+    """(scale, alpha, angle) bei Fortschritt t in [0, 1): größer -> kleiner + fade."""
+    scale = 1.0 + (0.25 * (1 - t))        # Start bei 1.25, Ende 1.0
+    alpha = int(255 * (1 - t))           # Fade-out
+    angle = (t * 25) - 12                # Rotation
+    return scale, alpha, angle
+
+
+def frame_index(t):
+    return min(int(t * POP_FRAMES), POP_FRAMES - 1)
+
+
+class PopEffect:
+    __slots__ = ("x", "y", "c", "size", "t")
+
+
+class EffectPool:
+    """Fester Pool an Effekten; neue Effekte bei vollem Pool werden verworfen.
+
+    Beendete Effekte werden per Swap-Remove in O(1) entfernt und wiederverwendet,
+    große Kaskaden erzeugen also weder Allokationen noch quadratisches ``list.remove``.
+    """
+
+    def __init__(self, capacity=1024):
+        self.capacity = capacity
+        self.free = [PopEffect() for _ in range(capacity)]
+        self.active = []
+
+    def spawn(self, x, y, c, size):
+        if not self.free:
+            return None
+        eff = self.free.pop()
+        eff.x, eff.y, eff.c, eff.size, eff.t = x, y, c, size, 0.0
+        self.active.append(eff)
+        return eff
+
+    def update(self, dt):
+        """Schiebt alle Effekte um dt (ms) weiter und gibt fertige an den Pool zurück."""
+        step = dt / POP_DURATION
+        active, free = self.active, self.free
+        i = 0
+        while i < len(active):
+            eff = active[i]
+            eff.t += step
+            if eff.t < 1.0:
+                i += 1
+                continue
+            free.append(eff)
+            last = active.pop()
+            if last is not eff:
+                # ``last`` rückt an Stelle i und wird als nächstes weitergeschoben
+                active[i] = last
+
+    def clear(self):
+        self.free.extend(self.active)
+        self.active.clear()
+
+    def __iter__(self):
+        return iter(self.active)
+
+    def __len__(self):
+        return len(self.active)
@@ -0,0 +1,164 @@
+"""Headless Spiel-Engine für Sort the CHICKENS! – kommt ohne pygame aus.
+
+Die Engine enthält den kompletten Spielzustand und die Regeln. ``main.py``
+steuert sie interaktiv, Simulationen und Tests benutzen sie direkt.
+"""
+import random
+
+from board import BOARDS
+
+# ----------------------------
+# Regeln / Defaults
+# ----------------------------
+GRID_W, GRID_H = 6, 6
+CHICKEN_TYPES = 4
+MAX_GRID = 256  # größte unterstützte Kantenlänge ("Mega-Board")
+# Bis zu dieser Zellenzahl wird das BitBoard genommen, nicht wegen der Zugzeit
+# (laut bench.py ist das ListBoard pro Zug etwas schneller, 6x6 wie 16x16),
+# sondern wegen ``key()``/``load()``: ein Tupel kleiner Masken als Schlüssel für
+# Tipp-Tabelle, Server-Sitzungen und Spielstände. Darüber kostet jedes
+# Setzen/Räumen eine Kopie der großen Integer-Masken, das ListBoard bleibt O(1).
+BITBOARD_MAX_CELLS = 16 * 16
+
+
+def default_board(width, height):
+    return "bitboard" if width * height <= BITBOARD_MAX_CELLS else "list"
+
+
+def new_pair(rng=random):
+    """Zieht ein zufälliges Paar: (offsets, orientation)."""
+    c1, c2 = rng.randint(0, CHICKEN_TYPES-1), rng.randint(0, CHICKEN_TYPES-1)
+    orientation = rng.choice(["h", "v"])
+    if orientation == "h":
+        offsets = [(0,0,c1), (1,0,c2)]
+    else:
+        offsets = [(0,0,c1), (0,1,c2)]
+    return offsets, orientation
+
+
+# alle Paare, die new_pair ziehen kann (gleich wahrscheinlich), als Offsets
+ALL_PAIRS = tuple(
+    ((0, 0, c1), (1, 0, c2)) if o == "h" else ((0, 0, c1), (0, 1, c2))
+    for c1 in range(CHICKEN_TYPES) for c2 in range(CHICKEN_TYPES) for o in ("h", "v"))
+
+
+def place_on_board(board, x, y, offsets):
+    """Setzt ein Paar auf ``board`` und räumt die Treffer; gibt die geräumten Zellen als (x, y, chicken_id) zurück.
+
+    Vor dem Setzen gibt es keine 3er-Reihen auf dem Brett, also kann jede neue
+    Reihe nur durch eine der gesetzten Zellen laufen – es reicht, deren Zeilen
+    und Spalten zu prüfen. Nach dem Räumen fällt nichts nach, daher genügt ein
+    einziger Durchgang.
+    """
+    placed = []
+    for ox, oy, c in offsets:
+        board.set(x + ox, y + oy, c)
+        placed.append((x + ox, y + oy))
+
+    matches = board.matches_around(placed)
+    cleared = [(mx, my, board.get(mx, my)) for (mx, my) in matches]
+    for (mx, my) in matches:
+        board.clear(mx, my)
+    return cleared
+
+
+def undo(board, x, y, offsets, cleared):
+    """Nimmt ``place_on_board`` zurück: Geräumtes wiederherstellen, gesetztes Paar entfernen."""
+    for mx, my, c in cleared:
+        board.set(mx, my, c)
+    for ox, oy, _ in offsets:
+        board.clear(x + ox, y + oy)
+
+
+class Game:
+    """Ein Spiel: Brett, Paare, Punktestand und Zustand (playing/victory/gameover)."""
+
+    def __init__(self, goal=256, seed=None, width=GRID_W, height=GRID_H, board=None):
+        if not (2 <= width <= MAX_GRID and 2 <= height <= MAX_GRID):
+            raise ValueError(f"Brettgröße {width}x{height} außerhalb von 2..{MAX_GRID}")
+        if board is None:
+            board = default_board(width, height)
+        self.width = width
+        self.height = height
+        self.goal = goal
+        # immer ein bekannter Seed, damit sich jedes Spiel wiederholen lässt (replay.py)
+        self.seed = random.getrandbits(63) if seed is None else seed
+        self.rng = random.Random(self.seed)
+        self.board = BOARDS[board](width, height, CHICKEN_TYPES)
+        self.rescued = 0
+        self.moves = 0
+        self.placements = []  # gespielte (x, y) in Reihenfolge, für Replays
+        self.state = "playing"
+        self.current_pair = new_pair(self.rng)
+        self.next_pair = new_pair(self.rng)
+
+    # --- Regeln (delegiert an das Brett-Backend) ---
+    def can_place(self, x, y, offsets=None):
+        if offsets is None:
+            offsets = self.current_pair[0]
+        return self.board.can_place(x, y, offsets)
+
+    def find_matches(self):
+        return self.board.find_matches()
+
+    def place_pair(self, x, y, offsets):
+        """Setzt ein Paar und löst Treffer auf (siehe ``place_on_board``)."""
+        cleared = place_on_board(self.board, x, y, offsets)
+        self.rescued += len(cleared)
+        return cleared
+
+    def any_move_possible(self, offsets=None):
+        if offsets is None:
+            offsets = self.current_pair[0]
+        return self.board.any_move_possible(offsets)
+
+    def legal_moves(self, offsets=None):
+        """Alle (x, y), an denen das Paar platziert werden kann."""
+        if offsets is None:
+            offsets = self.current_pair[0]
+        return self.board.legal_moves(offsets)
+
+    # --- Spielablauf ---
+    def place(self, x, y):
+        """Ein Zug mit dem aktuellen Paar.
+
+        Gibt die geräumten Zellen zurück, oder ``None`` wenn der Zug nicht erlaubt ist.
+        """
+        if self.state != "playing" or not self.can_place(x, y):
+            return None
+        cleared = self.place_pair(x, y, self.current_pair[0])
+        self.moves += 1
+        self.placements.append((x, y))
+        self.current_pair = self.next_pair
+        self.next_pair = new_pair(self.rng)
+
+        if self.rescued >= self.goal:
+            self.state = "victory"
+        elif not self.any_move_possible():
+            self.state = "gameover"
+        return cleared
+
+    @property
+    def over(self):
+        return self.state != "playing"
+
+
+# ----------------------------
+# Simulation
+# ----------------------------
+def random_policy(game, rng=random):
+    """Wählt einen zufälligen erlaubten Platz für das aktuelle Paar.
+
+    Bewusst nicht ``game.rng``, damit die Paarfolge eines Seeds unverändert bleibt.
+    """
+    return rng.choice(game.legal_moves())
+
+
+def play(game, policy=random_policy, max_moves=None):
+    """Spielt ``game`` mit ``policy`` bis zum Ende (oder ``max_moves``) und gibt es zurück."""
+    while not game.over:
+        if max_moves is not None and game.moves >= max_moves:
+            break
+        x, y = policy(game)
+        game.place(x, y)
+    return game
@@ -1,75 +1,303 @@
-import json
-import os
-import sys
-import tempfile
-
-def get_data_dir():
-    """Gibt einen Plattform-spezifischen, beschreibbaren Ordner zurück."""
-    if sys.platform == "win32":
-        base = os.getenv("APPDATA") or os.path.expanduser("~")
-        return os.path.join(base, "SortTheChickens")
-    elif sys.platform == "darwin":  # macOS
-        base = os.path.expanduser("~/Library/Application Support")
-        return os.path.join(base, "SaveTheChickens")
-    else:  # Linux und andere Unixes
-        base = os.path.expanduser("~/.local/share")
-        return os.path.join(base, "SaveTheChickens")
-
-DATA_DIR = get_data_dir()
-SCORE_FILE = os.path.join(DATA_DIR, "highscores.json")
-
-def load_scores():
-    os.makedirs(DATA_DIR, exist_ok=True)
-
-    if not os.path.exists(SCORE_FILE):
-        return []
-
-    try:
-        with open(SCORE_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            if isinstance(data, list):
-                return data
-            else:
-                # Falls Datei korrupt / nicht erwartet, überschreiben wir später
-                return []
-    except Exception as e:
-        # Im Entwicklermodus kann man hier ein Logging ergänzen; für die exe unterdrücken wir die Exception-Ausgabe.
-        # Wir geben eine leere Liste zurück, damit das Spiel weiterläuft.
-        return []
-
-
-def save_scores(scores):
-    """Schreibt die komplette Scores-Liste atomar (Tempfile + replace)."""
-    os.makedirs(DATA_DIR, exist_ok=True)
-    # Validierung: scores sollte eine Liste von dicts sein
-    try:
-        cleaned = []
-        for item in scores:
-            if isinstance(item, dict) and "name" in item and "score" in item:
-                cleaned.append({"name": str(item["name"]), "score": int(item["score"])})
-    except Exception:
-        cleaned = []
-
-    # Sortieren & Top 10
-    cleaned = sorted(cleaned, key=lambda x: x["score"], reverse=True)[:10]
-
-    # Atomares Schreiben: zuerst in Tempfile, dann ersetzen
-    try:
-        fd, tmp_path = tempfile.mkstemp(prefix="hs_", dir=DATA_DIR, text=True)
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump(cleaned, f, indent=4, ensure_ascii=False)
-        os.replace(tmp_path, SCORE_FILE)
-    except Exception:
-        # Falls Schreiben fehlschlägt, ignorieren wir, damit das Spiel nicht abstürzt.
-        pass
-
-
-def add_score(name, score):
-    """Bequeme Funktion: lädt, fügt hinzu, speichert (Top 10)."""
-    try:
-        scores = load_scores()
-        scores.append({"name": str(name), "score": int(score)})
-        save_scores(scores)
-    except Exception:
-        # defensiv: niemals einen Fehler hier hochwerfen
-        pass
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+def get_data_dir():
+    """Gibt einen Plattform-spezifischen, beschreibbaren Ordner zurück."""
+    if sys.platform == "win32":
+        base = os.getenv("APPDATA") or os.path.expanduser("~")
+        return os.path.join(base, "SortTheChickens")
+    elif sys.platform == "darwin":  # macOS
+        base = os.path.expanduser("~/Library/Application Support")
+        return os.path.join(base, "SaveTheChickens")
+    else:  # Linux und andere Unixes
+        base = os.path.expanduser("~/.local/share")
+        return os.path.join(base, "SaveTheChickens")
+
+DATA_DIR = get_data_dir()
+SCORE_FILE = os.path.join(DATA_DIR, "highscores.json")
+SCORE_DB = os.path.join(DATA_DIR, "highscores.db")
+
+# Schwierigkeitsstufen = Ziel an Hühnern (Easy / Medium / Hardcore)
+DIFFICULTIES = (128, 256, 512)
+TOP_N = 10
+
+# Speicher-Backend: "sqlite" (Standard) oder "json" (alte Einzeldatei)
+BACKEND = os.environ.get("CHICKENS_SCORES", "sqlite")
+
+# In-Memory-Cache: der Highscore-Bildschirm fragt jedes Frame, die Datei ändert sich selten.
+# Eigene Änderungen (add_score) aktualisieren den Cache direkt, Änderungen anderer
+# Prozesse werden über mtime/Größe erkannt – geprüft höchstens alle CHECK_INTERVAL Sekunden.
+CHECK_INTERVAL = 2.0
+_cache = {}  # difficulty -> Liste
+_cached_signature = None
+_last_check = 0.0
+_version = 0
+_store = None
+
+# Warteschlange für Group-Commit: wer zuerst schreibt, nimmt alle wartenden Einträge mit
+_pending = []
+_pending_lock = threading.Lock()
+_flush_lock = threading.Lock()
+last_error = None  # letzter Schreibfehler (None = alles gespeichert)
+
+
+def difficulty_for(score):
+    """Stufe eines Eintrags ohne Angabe: Siege enden knapp über dem Ziel."""
+    best = DIFFICULTIES[0]
+    for goal in DIFFICULTIES:
+        if score >= goal:
+            best = goal
+    return best
+
+def load_scores():
+    os.makedirs(DATA_DIR, exist_ok=True)
+
+    if not os.path.exists(SCORE_FILE):
+        return []
+
+    try:
+        with open(SCORE_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+            if isinstance(data, list):
+                return data
+            else:
+                # Falls Datei korrupt / nicht erwartet, überschreiben wir später
+                return []
+    except Exception as e:
+        # Im Entwicklermodus kann man hier ein Logging ergänzen; für die exe unterdrücken wir die Exception-Ausgabe.
+        # Wir geben eine leere Liste zurück, damit das Spiel weiterläuft.
+        return []
+
+
+def _file_signature():
+    try:
+        st = os.stat(get_store().path)
+        return (st.st_mtime_ns, st.st_size)
+    except (OSError, sqlite3.DatabaseError):  # fehlende oder beschädigte Datenbank
+        return None
+
+
+def _changed():
+    """Änderungsmitteilung: Cache leeren, neue Signatur merken."""
+    global _cached_signature, _last_check, _version
+    _cache.clear()
+    _cached_signature = _file_signature()
+    _last_check = time.monotonic()
+    _version += 1
+
+
+def invalidate_cache():
+    """Erzwingt beim nächsten cached_scores() ein Neuladen."""
+    global _version
+    _cache.clear()
+    _version += 1
+
+
+def cached_scores(difficulty=None):
+    """Top-Liste (einer Stufe) aus dem Speicher. Die Liste bitte nicht verändern."""
+    global _cached_signature, _last_check, _version
+    now = time.monotonic()
+    if now - _last_check >= CHECK_INTERVAL:
+        _last_check = now
+        signature = _file_signature()
+        if signature != _cached_signature:
+            _cache.clear()
+            _cached_signature = signature
+            _version += 1
+    if difficulty not in _cache:
+        try:
+            _cache[difficulty] = get_store().top(difficulty, TOP_N)
+        except Exception:
+            _cache[difficulty] = []
+    return _cache[difficulty]
+
+
+def scores_version():
+    """Zähler, der sich bei jeder Änderung der gecachten Scores erhöht."""
+    return _version
+
+
+@contextmanager
+def locked(path):
+    """Exklusive, prozessübergreifende Sperre über ``<path>.lock``.
+
+    Mehrere Spielinstanzen (z.B. Automaten mit gemeinsamem Datenordner) schreiben
+    so nacheinander statt sich gegenseitig Einträge zu überschreiben.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path + ".lock", "a+b") as f:
+        if sys.platform == "win32":
+            import msvcrt
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue  # LK_LOCK gibt nach ~10s auf, weiter warten
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def save_scores(scores):
+    """Schreibt die komplette Scores-Liste atomar (Tempfile + replace)."""
+    try:
+        write_scores(scores)
+    except Exception:
+        # Falls Schreiben fehlschlägt, ignorieren wir, damit das Spiel nicht abstürzt.
+        pass
+
+
+def write_scores(scores):
+    """Wie save_scores, wirft aber Fehler weiter."""
+    os.makedirs(DATA_DIR, exist_ok=True)
+    # Validierung: scores sollte eine Liste von dicts sein
+    try:
+        cleaned = []
+        for item in scores:
+            if isinstance(item, dict) and "name" in item and "score" in item:
+                entry = {"name": str(item["name"]), "score": int(item["score"])}
+                if item.get("difficulty") is not None:
+                    entry["difficulty"] = int(item["difficulty"])
+                if item.get("moves") is not None:
+                    entry["moves"] = int(item["moves"])
+                cleaned.append(entry)
+    except Exception:
+        cleaned = []
+
+    # Sortieren & Top 10 pro Stufe
+    cleaned = sorted(cleaned, key=lambda x: x["score"], reverse=True)
+    per_level = {}
+    kept = []
+    for entry in cleaned:
+        level = entry.get("difficulty") or difficulty_for(entry["score"])
+        per_level[level] = per_level.get(level, 0) + 1
+        if per_level[level] <= TOP_N:
+            kept.append(entry)
+    cleaned = kept
+
+    # Atomares Schreiben: zuerst in Tempfile, dann ersetzen
+    fd, tmp_path = tempfile.mkstemp(prefix="hs_", dir=DATA_DIR, text=True)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(cleaned, f, indent=4, ensure_ascii=False)
+        os.replace(tmp_path, SCORE_FILE)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    _changed()  # Änderungsmitteilung an den Cache
+
+
+class JSONScoreStore:
+    """Das bisherige Format: eine JSON-Liste, Top 10 pro Stufe."""
+
+    @property
+    def path(self):
+        return SCORE_FILE
+
+    def add(self, name, score, difficulty=None, moves=None):
+        self.add_many([(name, score, difficulty, moves)])
+
+    def add_many(self, entries):
+        """Laden, ergänzen, schreiben – unter Dateisperre, für alle Einträge in einem Rutsch."""
+        with locked(SCORE_FILE):
+            scores = load_scores()
+            for name, score, difficulty, moves in entries:
+                scores.append({"name": str(name), "score": int(score),
+                               "difficulty": difficulty, "moves": moves})
+            write_scores(scores)
+
+    def _level(self, difficulty):
+        entries = [e for e in load_scores() if isinstance(e, dict) and "score" in e]
+        if difficulty is not None:
+            entries = [e for e in entries if (e.get("difficulty") or difficulty_for(e["score"])) == difficulty]
+        return sorted(entries, key=lambda e: e["score"], reverse=True)
+
+    def top(self, difficulty=None, limit=TOP_N, offset=0):
+        return self._level(difficulty)[offset:offset + limit]
+
+    def rank(self, difficulty, name):
+        for i, e in enumerate(self._level(difficulty)):
+            if e.get("name") == name:
+                return i + 1
+        return None
+
+
+def get_store():
+    """Das aktive Speicher-Backend (siehe BACKEND)."""
+    global _store
+    if _store is None:
+        if BACKEND == "json":
+            _store = JSONScoreStore()
+        else:
+            from score_db import SQLiteScoreStore
+            _store = SQLiteScoreStore(SCORE_DB, migrate_from=SCORE_FILE)
+    return _store
+
+
+def submit_score(name, score, difficulty=None, moves=None):
+    """Stellt einen Score in die Warteschlange; geschrieben wird mit flush_scores()."""
+    if difficulty is None:
+        difficulty = difficulty_for(int(score))
+    with _pending_lock:
+        _pending.append((str(name), int(score), int(difficulty), None if moves is None else int(moves)))
+
+
+def flush_scores():
+    """Schreibt alle wartenden Scores in einer Transaktion (Group-Commit).
+
+    Gibt True zurück, wenn nichts mehr aussteht. Bei einem Fehler bleiben die
+    Einträge in der Warteschlange (nächster Versuch), der Fehler steht in ``last_error``.
+    """
+    global last_error
+    with _flush_lock:
+        with _pending_lock:
+            batch = _pending[:]
+            del _pending[:]
+        if not batch:
+            return True
+        try:
+            get_store().add_many(batch)
+        except Exception as e:
+            with _pending_lock:
+                _pending[:0] = batch
+            last_error = e
+            print(f"Warnung: Highscores konnten nicht gespeichert werden ({e}).", file=sys.stderr)
+            return False
+        last_error = None
+        _changed()
+        return True
+
+
+def pending_scores():
+    with _pending_lock:
+        return len(_pending)
+
+
+def add_score(name, score, difficulty=None, moves=None):
+    """Bequeme Funktion: Score einreihen und sofort schreiben. False bei Schreibfehler."""
+    try:
+        submit_score(name, score, difficulty, moves)
+    except (TypeError, ValueError) as e:
+        print(f"Warnung: ungültiger Score verworfen ({e}).", file=sys.stderr)
+        return False
+    return flush_scores()
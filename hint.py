@@ -0,0 +1,179 @@
+"""Tipp-Suche: Expectimax über aktuelles, nächstes und zufällige weitere Paare (ohne pygame).
+
+Ein Zug bringt die geräumten Hühner; danach ist das sichtbare nächste Paar
+dran, und jedes weitere Paar ist eines der 32 gleich wahrscheinlichen aus
+``new_pair`` (4 x 4 Farben x 2 Ausrichtungen). Am Suchhorizont zählt dazu ein
+kleiner Bonus für freie Paar-Plätze; Züge ohne Anschluss sind verloren.
+
+Die Suche läuft in Zeitscheiben (``HintEngine.step``, z.B. 5 ms pro Frame) mit
+iterativer Vertiefung. Fertige Teilbäume landen in einer Transpositionstabelle
+(LRU) über ``board.key()`` und überleben damit sowohl abgebrochene Scheiben als
+auch den nächsten Zug; ein angefangener Horizont merkt sich Zugindex und bisher
+besten Wert, damit auch er über Scheiben hinweg fertig wird.
+
+Tipps gibt es nur bis ``BITBOARD_MAX_CELLS`` Zellen: dort ist der Schlüssel ein
+Tupel weniger kleiner Masken, und die Tabelle wird über ``tt_bytes`` begrenzt.
+Auf größeren Brettern würden schon Brettkopie und Zugliste die Scheibe sprengen.
+"""
+import time
+
+from engine import ALL_PAIRS, BITBOARD_MAX_CELLS, place_on_board, undo
+from render_cache import LRUCache
+
+WIN = 1000.0
+LOST = -1000.0
+MOBILITY = 0.02  # Bewertung pro freiem Paar-Platz am Horizont
+# Anteil der Scheibe, nach dem die Suche aufhört: Rest für Abbau (undo) und Ausreißer
+HEADROOM = 0.8
+
+
+class _Timeout(Exception):
+    pass
+
+
+class HintEngine:
+    """Schlägt einen Platz für das aktuelle Paar vor, ohne den Frame zu blockieren."""
+
+    def __init__(self, max_depth=3, tt_size=100_000, tt_bytes=32 << 20):
+        self.max_depth = max_depth
+        self.tt_size = tt_size
+        self.tt_bytes = tt_bytes
+        self.tt = LRUCache(maxsize=tt_size)
+        self._tt_shape = None  # Brettgröße, für die ``tt.maxsize`` berechnet ist
+        self._partial = {}   # Schlüssel -> (Zugindex, bester Wert) eines abgebrochenen Horizonts
+        self.nodes = 0
+        self._target = None  # (Spiel, Zugnummer), für das gerade gesucht wird
+        self._moves = ()
+        self.best = None
+        self.depth = 0       # vollständig durchsuchte Tiefe
+
+    @staticmethod
+    def supports(game):
+        return game.width * game.height <= BITBOARD_MAX_CELLS
+
+    @staticmethod
+    def entry_bytes(width, height, types=4):
+        """Grobe Größe eines Tabelleneintrags: Schlüsseltupel, Masken, Wert, LRU-Verwaltung."""
+        return 400 + types * (32 + width * (height + 1) // 8)
+
+    def _restart(self, game):
+        self._target = (game, game.moves)
+        self._moves = ()
+        self._partial.clear()
+        self.best = None
+        self.depth = 0
+        if not self.supports(game):
+            return  # keine Suche: ``done`` ist sofort wahr
+        shape = (game.width, game.height)
+        if shape != self._tt_shape:
+            # andere Brettgröße: keine gemeinsamen Schlüssel, Grenze neu nach Bytes
+            self.tt.clear()
+            self.tt.maxsize = max(1, min(self.tt_size, self.tt_bytes // self.entry_bytes(*shape)))
+            self._tt_shape = shape
+        self._board = game.board.copy()  # das Spielbrett selbst bleibt unberührt
+        self._pairs = (tuple(game.current_pair[0]), tuple(game.next_pair[0]))
+        self._need = game.goal - game.rescued
+        self._moves = self._board.legal_moves(self._pairs[0])
+        self._scores = []    # Bewertungen der Wurzelzüge in der laufenden Tiefe
+
+    def step(self, game, budget_ms=5.0):
+        """Sucht höchstens ``budget_ms`` weiter (Neustart eingerechnet); bisher bester Zug (x, y) oder None."""
+        if game.over:
+            return None
+        self._deadline = time.perf_counter() + HEADROOM * budget_ms / 1000.0
+        if self._target != (game, game.moves):
+            self._restart(game)
+        if not self._moves or self.depth >= self.max_depth:
+            return self.best
+        try:
+            self._tick()  # Neustart kann die Scheibe schon verbraucht haben
+            while self.depth < self.max_depth:
+                self._search_root(self.depth + 1)
+        except _Timeout:
+            pass
+        return self.best
+
+    @property
+    def done(self):
+        """Suche für das zuletzt an ``step`` übergebene Spiel abgeschlossen."""
+        return self.depth >= self.max_depth or not self._moves
+
+    def _tick(self):
+        self.nodes += 1
+        if time.perf_counter() > self._deadline:
+            raise _Timeout
+
+    def _search_root(self, depth):
+        # Wurzel zugweise fortsetzbar: abgebrochene Scheiben verlieren keine fertigen Züge
+        board, (cur, nxt), need = self._board, self._pairs, self._need
+        scores = self._scores
+        while len(scores) < len(self._moves):
+            x, y = self._moves[len(scores)]
+            scores.append(self._after_move(board, x, y, cur, nxt, need, depth))
+        i = max(range(len(scores)), key=scores.__getitem__)
+        self.best = self._moves[i]
+        self.depth = depth
+        self._scores = []
+
+    def _after_move(self, board, x, y, cur, nxt, need, depth):
+        """Wert von Zug (x, y) mit ``cur``, danach ``nxt`` bekannt, insgesamt ``depth`` Züge."""
+        self._tick()
+        cleared = place_on_board(board, x, y, cur)
+        try:
+            gain = len(cleared)
+            if gain >= need:
+                return WIN + gain
+            if depth == 1:
+                return gain + MOBILITY * (board.slots.h + board.slots.v)
+            if depth == 2:
+                # über die Tabelle: kleine fertige Einheiten, damit jede Scheibe Fortschritt macht
+                return gain + self._max_value(board, nxt, None, need - gain, 1)
+            # danach unbekanntes Paar: Mittel über alle möglichen
+            total = 0.0
+            for pair in ALL_PAIRS:
+                total += self._max_value(board, nxt, pair, need - gain, depth - 1)
+            return gain + total / len(ALL_PAIRS)
+        finally:
+            undo(board, x, y, cur, cleared)
+
+    def _horizon(self, board, cur, need, key):
+        """Bester letzter Zug: nur setzen, Treffer zählen, wieder entfernen (ohne Räumen).
+
+        Bei Zeitablauf bleiben Zugindex und bester Wert unter ``key`` stehen; die
+        nächste Scheibe kommt über denselben Pfad hierher und macht dort weiter.
+        """
+        moves = board.legal_moves(cur)
+        if not moves:
+            return LOST
+        start, best = self._partial.pop(key, (0, LOST))
+        for i in range(start, len(moves)):
+            x, y = moves[i]
+            try:
+                self._tick()
+            except _Timeout:
+                self._partial[key] = (i, best)
+                raise
+            placed = [(x + ox, y + oy) for ox, oy, _ in cur]
+            for (px, py), (_, _, c) in zip(placed, cur):
+                board.set(px, py, c)
+            gain = len(board.matches_around(placed))
+            # freie Plätze mit gesetztem Paar; was das Räumen frei macht, steckt schon in gain
+            value = WIN + gain if gain >= need else gain + MOBILITY * (board.slots.h + board.slots.v)
+            for px, py in placed:
+                board.clear(px, py)
+            if value > best:
+                best = value
+        return best
+
+    def _max_value(self, board, cur, nxt, need, depth):
+        key = (board.key(), cur, nxt, need, depth)
+
+        def search():
+            if depth == 1:
+                return self._horizon(board, cur, need, key)
+            moves = board.legal_moves(cur)
+            if not moves:
+                return LOST
+            return max(self._after_move(board, x, y, cur, nxt, need, depth) for x, y in moves)
+
+        return self.tt.get(key, search)
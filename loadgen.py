@@ -0,0 +1,128 @@
+"""Lastgenerator für server.py: viele Clients spielen Zufallszüge, gemessen werden Latenz und Züge/s.
+
+Aufruf:  python loadgen.py [--clients 100] [--sessions 10] [--duration 10]
+                           [--difficulty 256] [--host 127.0.0.1] [--port 8765] [--spawn]
+
+Jeder Client hält eine Verbindung und spielt reihum ``--sessions`` Partien
+(eine Anfrage zur Zeit, wie ein Browser-Tab). Beendete Partien werden sofort
+durch neue ersetzt. ``--spawn`` startet den Server als eigenen Prozess, damit
+Client und Server nicht um dieselbe Event-Loop konkurrieren.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+from highscore import DIFFICULTIES
+from profiler import percentile
+
+
+def legal_moves(state):
+    """Ankerzellen, an denen das aktuelle Paar passt (aus ``state["board"]``)."""
+    board, w, h = state["board"], state["width"], state["height"]
+    dx, dy = (1, 0) if state["current"]["orientation"] == "h" else (0, 1)
+    return [(x, y) for x in range(w - dx) for y in range(h - dy)
+            if board[x][y] == "." and board[x + dx][y + dy] == "."]
+
+
+class Client:
+    def __init__(self, host, port, sessions, difficulty, seed, stats):
+        self.host, self.port = host, port
+        self.n_sessions = sessions
+        self.difficulty = difficulty
+        self.rng = random.Random(seed)
+        self.stats = stats  # gemeinsam: Latenzen je Operation, Züge, Partien
+
+    async def request(self, reader, writer, message):
+        t = time.perf_counter()
+        writer.write(json.dumps(message).encode() + b"\n")
+        response = json.loads(await reader.readline())
+        self.stats["latency"][message["op"]].append((time.perf_counter() - t) * 1000)
+        if not response.get("ok"):
+            raise RuntimeError(f"Server meldet Fehler: {response.get('error')}")
+        return response
+
+    async def new_game(self, reader, writer):
+        self.stats["games"] += 1
+        response = await self.request(reader, writer, {"op": "new", "difficulty": self.difficulty,
+                                                       "seed": self.rng.getrandbits(63)})
+        return response["state"]
+
+    async def run(self, deadline):
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            states = [await self.new_game(reader, writer) for _ in range(self.n_sessions)]
+            while time.perf_counter() < deadline:
+                for i, state in enumerate(states):
+                    x, y = self.rng.choice(legal_moves(state))
+                    response = await self.request(reader, writer, {"op": "place", "session": state["session"],
+                                                                   "x": x, "y": y})
+                    self.stats["moves"] += 1
+                    state = response["state"]
+                    if state["state"] != "playing":
+                        state = await self.new_game(reader, writer)
+                    states[i] = state
+        finally:
+            writer.close()
+
+
+async def run_load(args):
+    stats = {"latency": {"new": [], "place": []}, "moves": 0, "games": 0}
+    clients = [Client(args.host, args.port, args.sessions, args.difficulty, i, stats)
+               for i in range(args.clients)]
+    t = time.perf_counter()
+    await asyncio.gather(*(c.run(t + args.duration) for c in clients))
+    return stats, time.perf_counter() - t
+
+
+async def wait_for_server(host, port, timeout=10.0):
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+            writer.close()
+            return
+        except OSError:
+            if time.perf_counter() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--clients", type=int, default=100, help="gleichzeitige Verbindungen")
+    ap.add_argument("--sessions", type=int, default=10, help="Partien pro Verbindung")
+    ap.add_argument("--duration", type=float, default=10.0, help="Sekunden")
+    ap.add_argument("--difficulty", type=int, choices=DIFFICULTIES, default=DIFFICULTIES[1])
+    ap.add_argument("--spawn", action="store_true", help="server.py selbst starten")
+    args = ap.parse_args()
+
+    server = None
+    if args.spawn:
+        script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "server.py")
+        server = subprocess.Popen([sys.executable, script, "--host", args.host, "--port", str(args.port)],
+                                  stdout=subprocess.DEVNULL)
+    try:
+        asyncio.run(wait_for_server(args.host, args.port))
+        stats, elapsed = asyncio.run(run_load(args))
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    print(f"{args.clients} Verbindungen x {args.sessions} Partien, {elapsed:.1f}s: "
+          f"{stats['moves'] / elapsed:,.0f} Züge/s, {stats['games']} Partien")
+    for op, values in stats["latency"].items():
+        if values:
+            print(f"  {op:<6} {len(values):>8} Anfragen   p50 {percentile(values, 50):6.2f} ms   "
+                  f"p99 {percentile(values, 99):6.2f} ms   max {max(values):6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
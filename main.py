@@ -1,9 +1,23 @@
+import time
+STARTUP_T0 = time.perf_counter()  # für --startup-time, vor dem pygame-Import gemessen
 import pygame
-import random
 import sys
 import os
 import math
-from highscore import add_score, load_scores
+from highscore import add_score, flush_scores, cached_scores, scores_version, DIFFICULTIES, DATA_DIR
+from engine import Game, GRID_W, GRID_H, CHICKEN_TYPES, MAX_GRID
+from viewport import Viewport
+from render_cache import LRUCache
+from effects import EffectPool, frame_index
+from sprites import blend, pop_atlas
+from dirty import DirtyRects
+from assets import Preloader, resolve_font
+from bundle import AssetBundle, BUNDLE_FILE
+from replay import Replay, save as save_replays
+from snapshot import save as save_snapshot, load as load_snapshot
+from hint import HintEngine
+from profiler import Profiler, LatencyProbe, dump_base
+from board import BOARDS
 
 
 # ----------------------------
@@ -15,18 +29,54 @@ def resource_path(relpath: str) -> str:
         return os.path.join(sys._MEIPASS, relpath)
     return os.path.join(os.path.abspath("."), relpath)
 
+def board_size_arg(default=(GRID_W, GRID_H)):
+    """Brettgröße aus ``--board WxH`` oder der Umgebungsvariable CHICKENS_BOARD."""
+    spec = os.environ.get("CHICKENS_BOARD")
+    if "--board" in sys.argv[:-1]:
+        spec = sys.argv[sys.argv.index("--board") + 1]
+    if not spec:
+        return default
+    try:
+        w, h = (int(v) for v in spec.lower().split("x"))
+    except ValueError:
+        print(f"Warnung: ungültige Brettgröße '{spec}', nutze {default[0]}x{default[1]}.")
+        return default
+    return max(2, min(w, MAX_GRID)), max(2, min(h, MAX_GRID))
+
 # ----------------------------
 # Config
 # ----------------------------
-GRID_W, GRID_H = 6, 6
+BOARD_W, BOARD_H = board_size_arg()  # Spielbrett, z.B. --board 256x256 für Mega-Board
 TILE_SIZE = 72
+VIEW_TILES = 6  # sichtbare Kacheln bei Standardzoom, größere Bretter werden gescrollt
+BOARD_PX = VIEW_TILES * TILE_SIZE
 PADDING = 20
 INFO_PANEL_H = 100
-SCREEN_W = GRID_W * TILE_SIZE + PADDING * 2 + 240
-SCREEN_H = GRID_H * TILE_SIZE + PADDING * 2 + INFO_PANEL_H
+SCREEN_W = BOARD_PX + PADDING * 2 + 240
+SCREEN_H = BOARD_PX + PADDING * 2 + INFO_PANEL_H
 FPS = 60
-
-CHICKEN_TYPES = 4
+# Ruhige Bildschirme warten blockierend auf Eingaben statt 60 Frames/s zu zeichnen
+IDLE_WAIT = os.environ.get("CHICKENS_IDLE") != "0"
+IDLE_TIMEOUT_MS = 1000  # spätestens dann trotzdem ein Frame (Highscores anderer Prozesse, Musik)
+HINT_BUDGET_MS = 5.0  # Rechenzeit der Tipp-Suche pro Frame
+# Profiler: Zeit pro Phase + heiße Funktionen, Live-Anzeige; F3 schaltet um, Trace beim Beenden
+prof = Profiler(enabled=os.environ.get("CHICKENS_PROFILE") == "1")
+# Eingabe-bis-Bild-Latenz jeder Platzierung als Histogramm (Ausgabe beim Beenden)
+latency = LatencyProbe(enabled="--latency" in sys.argv or os.environ.get("CHICKENS_LATENCY") == "1")
+DEBUG_DIRTY = os.environ.get("CHICKENS_DEBUG_DIRTY") == "1"  # Taste F2 schaltet um
+REPLAY_FILE = os.path.join(DATA_DIR, "replays.rpl")  # jedes beendete Spiel, nachspielbar mit replay.py
+SAVE_FILE = os.path.join(DATA_DIR, "savegame.chk")  # laufendes Spiel (snapshot.py)
+# Spielstand höchstens so oft schreiben (O(Brett + Züge) pro Speichern); beim Verlassen immer
+AUTOSAVE_INTERVAL = 2.0
+# Startzeit messen: --startup-time (beendet nach dem ersten Frame) oder CHICKENS_STARTUP=1
+STARTUP_PROBE = "--startup-time" in sys.argv or os.environ.get("CHICKENS_STARTUP") == "1"
+startup_marks = []  # (Phase, Sekunden seit Start)
+
+def mark_startup(phase):
+    if STARTUP_PROBE:
+        startup_marks.append((phase, time.perf_counter() - STARTUP_T0))
+
+mark_startup("Imports")
 
 # Colors
 BG = (30, 30, 40)
@@ -52,196 +102,285 @@ try:
         menu_music = None
 except Exception:
     print("Warnung: Mixer konnte nicht initialisiert werden (kein Sound).")
+mark_startup("pygame.init")
 
 
 screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
 pygame.display.set_caption("Sort the CHICKENS! 🐔")
-clock = pygame.time.Clock()
+mark_startup("Fenster")
 
-# Fonts (mit emoji und fallback default)
+# Assets, die erst im Spiel gebraucht werden, lädt ein Hintergrund-Thread,
+# während das Menü schon läuft (CHICKENS_PRELOAD=0: erst bei Bedarf laden)
+preload = Preloader(background=os.environ.get("CHICKENS_PRELOAD", "1") != "0")
+
+# Fonts (mit emoji und fallback default); der gefundene Pfad wird über Starts gemerkt
 EMOJI_FONTS = ["Segoe UI Emoji", "Noto Color Emoji", "Apple Color Emoji", "Arial Unicode MS"]
-def load_font(size=28, emoji_test_char="🐔"):
-    for name in EMOJI_FONTS:
-        try:
-            f = pygame.font.SysFont(name, size)
-            surf = f.render(emoji_test_char, True, (0,0,0))
-            if surf.get_width() > 0:
-                return f
-        except Exception:
-            pass
-    return pygame.font.SysFont(None, size)
+FONT_PATH = resolve_font(EMOJI_FONTS)
+
+def load_font(size=28):
+    try:
+        return pygame.font.Font(FONT_PATH, size)
+    except Exception:
+        return pygame.font.Font(None, size)
 
 font = load_font(22)
 font_big = load_font(36)
 font_title = load_font(44)
 
+# Text-Surfaces: gleiche (Font, Text, Farbe) nur einmal rendern
+text_cache = LRUCache(maxsize=256)
+
+def font_render(fnt, text, color):
+    return fnt.render(text, True, color)
+
+def render_text(fnt, text, color):
+    return text_cache.get((fnt, text, color), lambda: font_render(fnt, text, color))
+
+
+mark_startup("Fonts")
+
 
 # ----------------------------
 # Sounds
 # ----------------------------
-def try_load_sound(path):
+def try_load_sound(path, volume):
     try:
         s = pygame.mixer.Sound(resource_path(path))
+        s.set_volume(volume)
         return s
     except Exception:
         return None
 
-sounds = {
-    "place": try_load_sound("assets\place.wav"),
-    "match": try_load_sound("assets\match.wav"),
-    "victory": try_load_sound("assets\win.wav"),
-    "gameover": try_load_sound("assets\gameover.wav"),
+# Name -> (Datei, Lautstärke); geladen im Hintergrund
+SOUND_FILES = {
+    "place": ("assets/place.wav", 0.4),
+    "match": ("assets/match.wav", 0.25),
+    "victory": ("assets/win.wav", 0.6),
+    "gameover": ("assets/gameover.wav", 0.5),
 }
+for name, (path, volume) in SOUND_FILES.items():
+    preload.submit(("sound", name), try_load_sound, path, volume)
 
-# volumes für Soundeffekte
-if sounds["place"]: sounds["place"].set_volume(0.4)
-if sounds["match"]: sounds["match"].set_volume(0.25)
-if sounds["victory"]: sounds["victory"].set_volume(0.6)
-if sounds["gameover"]: sounds["gameover"].set_volume(0.5)
+def play_sound(name):
+    s = preload.get(("sound", name))
+    if s:
+        s.play()
 
 # ----------------------------
 # Spieldaten
 # ----------------------------
-grid = [[-1 for _ in range(GRID_H)] for _ in range(GRID_W)]
-rescued = 0
-moves = 0
 GOAL_CHICKENS = 256  # default wert
-current_pair = None
-last_place_time = 0 
+game = Game(GOAL_CHICKENS, width=BOARD_W, height=BOARD_H)  # Regeln & Zustand: siehe engine.py
+view = Viewport(BOARD_W, BOARD_H, BOARD_PX, BOARD_PX, PADDING, PADDING)
 title_anim_time = 0
 
+# ----------------------------
+# Bilder: aus dem Asset-Bündel (fertig skaliert, per mmap) oder als lose Dateien
+# ----------------------------
+bundle = AssetBundle.open(resource_path(BUNDLE_FILE))  # erzeugt von bundle.py
+
+def decode_image(relpath, size=None):
+    """Noch ungewandelte Surface; aus dem Bündel bereits in ``size``. Auch im Hintergrund-Thread nutzbar."""
+    img = bundle.surface(relpath, size) if bundle else None
+    if img is None:
+        img = pygame.image.load(resource_path(relpath))
+    return img
+
+def finish_image(img, size=None, alpha=True):
+    """Ins Anzeigeformat wandeln und, falls noch nötig, skalieren (Hauptthread)."""
+    img = img.convert_alpha() if alpha else img.convert()
+    if size is not None and img.get_size() != size:
+        img = pygame.transform.smoothscale(img, size)
+    return img
+
+def load_image(relpath, size=None, alpha=True):
+    return finish_image(decode_image(relpath, size), size, alpha)
+
 # Menü-Hintergrundbild
-menu_bg = pygame.image.load(resource_path("assets\BG.png")).convert()
-menu_bg = pygame.transform.smoothscale(menu_bg, (SCREEN_W, SCREEN_H))
+menu_bg = load_image("assets/BG.png", (SCREEN_W, SCREEN_H), alpha=False)
 
 # Menü-Hühnerbild
-chicken_icon_custom_right = pygame.image.load(resource_path("assets/chickensleep.png")).convert_alpha()
-chicken_icon_custom_left  = pygame.image.load(resource_path("assets/chickensleep1.png")).convert_alpha()
+chicken_icon_custom_right = load_image("assets/chickensleep.png")
+chicken_icon_custom_left  = load_image("assets/chickensleep1.png")
+
+mark_startup("Menü-Assets")
+
+# Hühner Bilder: im Hintergrund dekodiert, convert_alpha/Skalieren beim ersten Zeichnen
+CHICKEN_SIZE = (TILE_SIZE-4, TILE_SIZE-4)
+
+def load_chicken_images():
+    return [decode_image(f"assets/chicken{i}.png", CHICKEN_SIZE) for i in range(CHICKEN_TYPES)]
 
-# Hühner Bilder
-chicken_images = []
-for i in range(CHICKEN_TYPES):
-    path = resource_path(f"assets\chicken{i}.png")
-    img = pygame.image.load(path).convert_alpha()
-    img = pygame.transform.smoothscale(img, (TILE_SIZE-4, TILE_SIZE-4))
-    chicken_images.append(img)
+preload.submit("chickens", load_chicken_images)
+
+# skalierte Hühner, {größe: [bilder]}; Standardgröße TILE_SIZE-4, kleinere für herausgezoomte Bretter
+scaled_chicken_images = {}
+
+def chicken_image(chicken_id, size):
+    imgs = scaled_chicken_images.get(size)
+    if imgs is None:
+        base = scaled_chicken_images.get(TILE_SIZE-4)
+        if base is None:
+            base = [finish_image(img, CHICKEN_SIZE) for img in preload.get("chickens")]
+            scaled_chicken_images[TILE_SIZE-4] = base
+        imgs = scaled_chicken_images.get(size)
+        if imgs is None:
+            # Zoomstufen liegen meist schon im Bündel, sonst aus der Standardgröße skalieren
+            imgs = []
+            for i, img in enumerate(base):
+                pre = bundle.surface(f"assets/chicken{i}.png", (size, size)) if bundle else None
+                imgs.append(pre.convert_alpha() if pre else pygame.transform.smoothscale(img, (size, size)))
+            scaled_chicken_images[size] = imgs
+    return imgs[chicken_id]
+
+# fertig geblendete Varianten (Transparenz / rote Vorschau), statt jedes Frame zu kopieren
+sprite_cache = LRUCache(maxsize=64)
+
+def chicken_sprite(chicken_id, size, alpha=255, tint=None):
+    return sprite_cache.get((chicken_id, size, alpha, tint),
+                            lambda: blend(chicken_image(chicken_id, size), alpha, tint))
 
 
 # States
 state = "menu"  # menu, playing, gameover, victory
 gameover_played = False
 victory_played = False
+saved_game = os.path.exists(SAVE_FILE)  # Menü zeigt "Fortsetzen"
+save_pending = False  # Züge seit dem letzten Speichern
+last_save = 0.0
+
+# Touchpad Platzierung: linke Taste gedrückt (aus den Events nachgeführt)
+mouse_held = False
+URGENT_EVENTS = {pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN}  # sofort verarbeiten
 
-# Touchpad Platzierung
-mouse_was_pressed = False
+# ----------------------------
+# Dirty Rects: im Spiel nur geänderte Bereiche neu zeichnen
+# ----------------------------
+dirty = DirtyRects(SCREEN_W, SCREEN_H)
+INFO_RECT = pygame.Rect(PADDING-6, PADDING + BOARD_PX + 14, BOARD_PX+12, INFO_PANEL_H)
+NEXT_PAIR_RECT = pygame.Rect(BOARD_PX + PADDING*2 + 20, PADDING + 10, 2*TILE_SIZE, 2*TILE_SIZE + 30)
+hover_state = None   # (Vorschau-Kacheln, Züge) des zuletzt gezeichneten Frames
+debug_rects = []     # Umrisse der Debug-Anzeige, werden im nächsten Frame wieder übermalt
+
+# Tipp (Taste T): Suche läuft in Zeitscheiben weiter, solange der Tipp an ist
+hints = HintEngine()
+hint_on = False
+hint_cells = ()  # Kacheln des angezeigten Vorschlags
+
+def tile_rect(gx, gy):
+    px, py = view.tile_pos(gx, gy)
+    return pygame.Rect(px, py, view.tile, view.tile)
+
+def mark_tiles(cells):
+    for gx, gy in cells:
+        if view.contains(gx, gy):
+            dirty.add(tile_rect(gx, gy))
 
 # ----------------------------
-# Spiellogik
+# Spiellogik (Regeln in engine.py)
 # ----------------------------
-def new_pair():
-    c1, c2 = random.randint(0, CHICKEN_TYPES-1), random.randint(0, CHICKEN_TYPES-1)
-    orientation = random.choice(["h", "v"])
-    if orientation == "h":
-        offsets = [(0,0,c1), (1,0,c2)]
+# Pop-Animationen: fester Effekt-Pool + vorberechnete Einzelbilder je (Huhn, Größe)
+pop_effects = EffectPool()
+pop_frame_cache = {}
+
+def pop_frames(chicken_id, size):
+    frames = pop_frame_cache.get((chicken_id, size))
+    if frames is None:
+        frames = pop_frame_cache[(chicken_id, size)] = pop_atlas(chicken_image(chicken_id, size))
+    return frames
+
+
+def place_pair(x, y):
+    """Spielt das aktuelle Paar bei (x, y) über die Engine, inkl. Sound und Pop-Effekten."""
+    placed = [(x + ox, y + oy) for ox, oy, _ in game.current_pair[0]]
+    cleared = game.place(x, y)
+    if cleared is None:
+        return False
+
+    # geänderte Bereiche: gesetzte + geräumte Kacheln, Zähler, nächstes Paar
+    mark_tiles(placed)
+    mark_tiles([(mx, my) for mx, my, _ in cleared])
+    dirty.add(INFO_RECT)
+    dirty.add(NEXT_PAIR_RECT)
+
+    play_sound("place")
+    for (mx, my, c) in cleared:
+        # Animation hinzufügen (bei vollem Pool fällt der Effekt weg)
+        if 0 <= c < CHICKEN_TYPES:
+            pop_effects.spawn(mx, my, c, view.inner)
+
+    # Match-Sound abspielen
+    if cleared:
+        play_sound("match")
+
+    if game.over:
+        record_replay()
+        drop_save()
     else:
-        offsets = [(0,0,c1), (0,1,c2)]
-    return offsets, orientation
-
-def can_place(x, y, offsets):
-    for ox, oy, _ in offsets:
-        tx, ty = x + ox, y + oy
-        if tx < 0 or tx >= GRID_W or ty < 0 or ty >= GRID_H: return False
-        if grid[tx][ty] != -1: return False
+        autosave()
     return True
 
-def find_matches():
-    matches = set()
-    # horizontal
-    for y in range(GRID_H):
-        run_len = 1
-        for x in range(1, GRID_W+1):
-            if x < GRID_W and grid[x][y] != -1 and grid[x][y] == grid[x-1][y]:
-                run_len += 1
-            else:
-                if run_len >= 3:
-                    for k in range(run_len):
-                        matches.add((x-1-k, y))
-                run_len = 1
-    # vertikal
-    for x in range(GRID_W):
-        run_len = 1
-        for y in range(1, GRID_H+1):
-            if y < GRID_H and grid[x][y] != -1 and grid[x][y] == grid[x][y-1]:
-                run_len += 1
-            else:
-                if run_len >= 3:
-                    for k in range(run_len):
-                        matches.add((x, y-1-k))
-                run_len = 1
-    return matches
 
-# Pop-Animationen Liste für Effekte
-pop_effects = [] 
+def autosave(force=False):
+    """Merkt den Zug vor; geschrieben wird nur alle AUTOSAVE_INTERVAL Sekunden oder mit ``force``."""
+    global saved_game, save_pending, last_save
+    save_pending = True
+    now = time.perf_counter()
+    if not force and now - last_save < AUTOSAVE_INTERVAL:
+        return
+    save_pending = False
+    last_save = now
+    try:
+        save_snapshot(SAVE_FILE, game)
+        saved_game = True
+    except OSError as e:
+        print("Warnung: Spielstand konnte nicht gespeichert werden:", e)
 
 
-def place_pair(x, y, offsets):
-    global rescued
-    for ox, oy, c in offsets:
-        tx, ty = x + ox, y + oy
-        grid[tx][ty] = c
+def flush_save():
+    """Vorgemerkten Zug sofort speichern (Menü, Beenden)."""
+    if save_pending and not game.over:
+        autosave(force=True)
+
+
+def drop_save():
+    global saved_game, save_pending
+    saved_game = False
+    save_pending = False
+    try:
+        os.remove(SAVE_FILE)
+    except OSError:
+        pass
+
+
+def record_replay():
+    try:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        save_replays(REPLAY_FILE, [Replay.from_game(game)])
+    except OSError as e:
+        print("Warnung: Replay konnte nicht gespeichert werden:", e)
 
-    if sounds["place"]: sounds["place"].play()
-    # Übereinstimmungen auflösen
-    while True:
-        matches = find_matches()
-        if not matches:
-            break
-        for (mx, my) in matches:
-            # Animation hinzufügen — Originalbild sichern
-            if 0 <= grid[mx][my] < len(chicken_images):
-                pop_effects.append({
-                    "x": mx,
-                    "y": my,
-                    "img": chicken_images[grid[mx][my]].copy(),
-                    "t": 0.0  # Zeitstempel für Animation
-                })
-
-            grid[mx][my] = -1
-            rescued += 1
-        
-        # Match-Sound abspielen
-        if sounds["match"]:
-            sounds["match"].play()
-
-
-def any_move_possible(offsets):
-    for x in range(GRID_W):
-        for y in range(GRID_H):
-            if can_place(x, y, offsets):
-                return True
-    return False
 
 def reset_game_to_menu():
     pygame.mixer.music.stop()
-    global grid, rescued, moves, current_pair, state, gameover_played, victory_played, GOAL_CHICKENS
-    grid = [[-1 for _ in range(GRID_H)] for _ in range(GRID_W)]
-    rescued = 0
-    moves = 0
-    current_pair = new_pair()
+    global game, view, state, gameover_played, victory_played
+    flush_save()
+    pop_effects.clear()
+    game = Game(GOAL_CHICKENS, width=BOARD_W, height=BOARD_H)
+    view = Viewport(BOARD_W, BOARD_H, BOARD_PX, BOARD_PX, PADDING, PADDING)
     state = "menu"
     gameover_played = False
     victory_played = False
     
 
-def start_game(goal):
+def start_game(goal, resumed=None):
     pygame.mixer.music.stop()
-    global GOAL_CHICKENS, current_pair, next_pair, state, rescued, moves, gameover_played, victory_played
+    global GOAL_CHICKENS, game, view, state, gameover_played, victory_played
     GOAL_CHICKENS = goal
-    grid[:] = [[-1 for _ in range(GRID_H)] for _ in range(GRID_W)]
-    rescued = 0
-    moves = 0
-    current_pair = new_pair()
-    next_pair = new_pair()  # das kommende Paar
+    pop_effects.clear()
+    # neues Brett, aktuelles + kommendes Paar – oder der geladene Spielstand
+    game = resumed or Game(goal, width=BOARD_W, height=BOARD_H)
+    view = Viewport(game.width, game.height, BOARD_PX, BOARD_PX, PADDING, PADDING)
     state = "playing"
     gameover_played = False
     victory_played = False
@@ -256,6 +395,20 @@ def start_game(goal):
             pass
 
 
+def resume_game():
+    """Setzt das automatisch gespeicherte Spiel fort."""
+    try:
+        resumed = load_snapshot(SAVE_FILE)
+    except (OSError, ValueError) as e:
+        print("Warnung: Spielstand konnte nicht geladen werden:", e)
+        drop_save()
+        return
+    if resumed.over:
+        drop_save()
+        return
+    start_game(resumed.goal, resumed)
+
+
 # ----------------------------
 # UI 
 # ----------------------------
@@ -263,164 +416,312 @@ def draw_button(rect, text, hover=False):
     color = BTN_HOVER if hover else BTN_BG
     pygame.draw.rect(screen, color, rect, border_radius=10)
     pygame.draw.rect(screen, (61, 32, 42), rect, 2, border_radius=10)
-    lbl = font.render(text, True, WHITE)
+    lbl = render_text(font, text, WHITE)
     screen.blit(lbl, lbl.get_rect(center=rect.center))
 
-def draw_game():
+def draw_game(clip=None):
+    """Zeichnet das Spiel; mit ``clip`` nur die Kacheln in diesem Bereich (Dirty Rects)."""
     # board
     screen.fill(BG)
-    pygame.draw.rect(screen, PANEL, (PADDING-6, PADDING-6, GRID_W*TILE_SIZE+12, GRID_H*TILE_SIZE+12), border_radius=16)
-    for x in range(GRID_W):
-        for y in range(GRID_H):
-            rect = pygame.Rect(PADDING + x*TILE_SIZE, PADDING + y*TILE_SIZE, TILE_SIZE-4, TILE_SIZE-4)
-            draw_chicken(rect, grid[x][y])
-
+    pygame.draw.rect(screen, PANEL, (PADDING-6, PADDING-6, view.cols*view.tile+12, view.rows*view.tile+12), border_radius=16)
+    # nur sichtbare Kacheln zeichnen (große Bretter)
+    x0, x1, y0, y1 = view.visible()
+    size = view.inner
+    get = game.board.get
+    tx0, tx1, ty0, ty1 = view.tiles_in(*clip) if clip else (x0, x1, y0, y1)
+    for x in range(tx0, tx1):
+        for y in range(ty0, ty1):
+            px, py = view.tile_pos(x, y)
+            draw_chicken(pygame.Rect(px, py, size, size), get(x, y))
+
+    # vorgeschlagener Platz (Tipp)
+    for hx, hy in (hint_cells if not game.over else ()):
+        if view.contains(hx, hy):
+            pygame.draw.rect(screen, ACCENT, tile_rect(hx, hy).inflate(-2, -2), 3, border_radius=12)
 
     # vorschau: kann nicht platziert werden, rot färben, sonst normal
-    if current_pair is not None:
-        mx, my = pygame.mouse.get_pos()
-        gx = (mx - PADDING) // TILE_SIZE
-        gy = (my - PADDING) // TILE_SIZE
-        if 0 <= gx < GRID_W and 0 <= gy < GRID_H:
-            valid = can_place(gx, gy, current_pair[0])
+    if game.current_pair is not None:
+        cell = view.to_grid(*pygame.mouse.get_pos())
+        if cell is not None:
+            gx, gy = cell
+            valid = game.can_place(gx, gy)
             if valid:
                 alpha = 140
                 tint = None
             else:
                 alpha = 180
                 tint = RED
-            for ox, oy, c in current_pair[0]:
-                rect = pygame.Rect(PADDING + (gx+ox)*TILE_SIZE, PADDING + (gy+oy)*TILE_SIZE, TILE_SIZE-4, TILE_SIZE-4)
-                draw_chicken(rect, c, alpha=alpha, tint=tint)
+            for ox, oy, c in game.current_pair[0]:
+                if not view.contains(gx+ox, gy+oy):
+                    continue
+                px, py = view.tile_pos(gx+ox, gy+oy)
+                draw_chicken(pygame.Rect(px, py, size, size), c, alpha=alpha, tint=tint)
 
     # nächstes paar box
-    base_x = GRID_W*TILE_SIZE + PADDING*2 + 20
+    base_x = BOARD_PX + PADDING*2 + 20
     base_y = PADDING + 40
-    label = font.render("Nächstes Paar:", True, WHITE)
+    label = render_text(font, "Nächstes Paar:", WHITE)
     screen.blit(label, (base_x, base_y-30))
-    for ox, oy, c in next_pair[0]:
+    for ox, oy, c in game.next_pair[0]:
         rect = pygame.Rect(base_x + ox*TILE_SIZE, base_y + oy*TILE_SIZE, TILE_SIZE-4, TILE_SIZE-4)
         draw_chicken(rect, c)
 
     # info panel unten 
-    info_y = PADDING + GRID_H*TILE_SIZE + 20
-    pygame.draw.rect(screen, PANEL, (PADDING-6, info_y-6, GRID_W*TILE_SIZE+12, INFO_PANEL_H), border_radius=16)
-    text1 = font.render(f"Sortiert: {rescued}/{GOAL_CHICKENS}", True, ACCENT)
-    text2 = font.render(f"Züge: {moves}", True, WHITE)
+    info_y = PADDING + BOARD_PX + 20
+    pygame.draw.rect(screen, PANEL, (PADDING-6, info_y-6, BOARD_PX+12, INFO_PANEL_H), border_radius=16)
+    text1 = render_text(font, f"Sortiert: {game.rescued}/{game.goal}", ACCENT)
+    text2 = render_text(font, f"Züge: {game.moves}", WHITE)
     screen.blit(text1, (PADDING+10, info_y+10))
     screen.blit(text2, (PADDING+10, info_y+40))
+    if view.scrollable:
+        text3 = render_text(font, f"Ausschnitt {x0},{y0} von {game.width}x{game.height}", GREY)
+        screen.blit(text3, (PADDING+180, info_y+40))
 
     # Pop-Animationen rendern
-    update_and_draw_pop_effects(dt)
+    draw_pop_effects()
+
+
+def draw_music_hint():
+    base_x = BOARD_PX + PADDING*2 + 20
+    base_y = PADDING + 125
+    label_hint = render_text(font, f"Musik: {'AN' if music_on else 'AUS'}  (Taste M)", GREY)
+    screen.blit(label_hint, (base_x, base_y + 70))
+    tip = "AUS" if not hint_on else "AN" if hints.supports(game) else "– (Brett zu groß)"
+    label_tip = render_text(font, f"Tipp: {tip}  (Taste T)", GREY)
+    screen.blit(label_tip, (base_x, base_y + 100))
+
+
+def update_hint():
+    """Tipp-Suche eine Zeitscheibe weiterrechnen; geänderten Vorschlag neu zeichnen lassen."""
+    global hint_cells
+    best = hints.step(game, HINT_BUDGET_MS) if hint_on else None
+    cells = ()
+    if best is not None:
+        cells = tuple((best[0]+ox, best[1]+oy) for ox, oy, _ in game.current_pair[0])
+    if cells != hint_cells:
+        mark_tiles(hint_cells)
+        mark_tiles(cells)
+        hint_cells = cells
+
+
+def render_playing(dt):
+    """Spiel-Frame mit Dirty Rects: zeichnet und überträgt nur geänderte Bereiche."""
+    global hover_state, debug_rects
+    update_hint()
+    if save_pending and time.perf_counter() - last_save >= AUTOSAVE_INTERVAL:
+        autosave()  # letzter Zug einer Serie, spätestens beim nächsten Frame nach dem Intervall
+    prof.lap("hint")
+    # Vorschau folgt der Maus bzw. ändert sich nach einem Zug
+    cell = view.to_grid(*pygame.mouse.get_pos())
+    cells = ()
+    if cell is not None:
+        cells = tuple((cell[0]+ox, cell[1]+oy) for ox, oy, _ in game.current_pair[0])
+    if (cells, game.moves) != hover_state:
+        if hover_state:
+            mark_tiles(hover_state[0])
+        mark_tiles(cells)
+        hover_state = (cells, game.moves)
+
+    # Effekte bleiben an ihrer Kachel, wachsen aber bis ~1.25x plus Drehung
+    grow = view.tile // 2
+    for eff in pop_effects:
+        if view.contains(eff.x, eff.y):
+            dirty.add(tile_rect(eff.x, eff.y).inflate(grow, grow))
+    pop_effects.update(dt)
+    prof.lap("effects")
+
+    for r in debug_rects:
+        dirty.add(r)
+    if prof.enabled:
+        dirty.add(PROFILE_RECT)
+    full, rects = dirty.take()
+    if not full and not rects:
+        return  # nichts geändert: weder zeichnen noch Display-Update
+
+    if full:
+        draw_game()
+        draw_music_hint()
+    else:
+        area = pygame.Rect(DirtyRects.bounds(rects))
+        screen.set_clip(area)
+        draw_game(clip=area)
+        draw_music_hint()
+        screen.set_clip(None)
+
+    debug_rects = []
+    if DEBUG_DIRTY and not full:
+        for r in rects:
+            pygame.draw.rect(screen, GREEN, r, 1)
+        debug_rects = rects
+    if prof.enabled:
+        draw_profile_overlay()
+    prof.lap("draw")
+
+    if full:
+        pygame.display.flip()
+    else:
+        pygame.display.update(rects)
+    latency.presented()
+    prof.lap("present")
+
+
+# Live-Anzeige des Profilers, nur alle 250 ms neu gesetzt (sonst flackern die Zahlen)
+PROFILE_RECT = pygame.Rect(4, 4, 420, 250)
+profile_font = None
+profile_surface = None
+profile_built = 0
+
+def draw_profile_overlay():
+    global profile_font, profile_surface, profile_built
+    now = pygame.time.get_ticks()
+    if profile_surface is None or now - profile_built > 250:
+        if profile_font is None:
+            profile_font = pygame.font.Font(None, 20)
+        profile_surface = pygame.Surface(PROFILE_RECT.size, pygame.SRCALPHA)
+        profile_surface.fill((0, 0, 0, 180))
+        # direkt gerendert: die Zahlen ändern sich ständig und sollen weder den
+        # Text-Cache verdrängen noch bei font.render mitgezählt werden
+        for i, line in enumerate(prof.overlay_lines()[:12]):
+            profile_surface.blit(profile_font.render(line, True, WHITE), (8, 6 + i * 20))
+        profile_built = now
+    screen.blit(profile_surface, PROFILE_RECT)
 
 
 def draw_chicken(rect, chicken_id, alpha=255, tint=None):
     if chicken_id < 0:
         pygame.draw.rect(screen, (60,65,80), rect, border_radius=12)
         return
-    img = chicken_images[chicken_id]
-    if tint:
-        # draw tinted version on the fly
-        temp = img.copy()
-        tint_surf = pygame.Surface(temp.get_size(), pygame.SRCALPHA)
-        tint_surf.fill((*tint, alpha))
-        temp.blit(tint_surf, (0,0), special_flags=pygame.BLEND_RGBA_MULT)
-        temp.set_alpha(255 if alpha >= 255 else alpha)
-        screen.blit(temp, rect)
-    else:
-        tmp = img.copy()
-        tmp.set_alpha(alpha)
-        screen.blit(tmp, rect)
-
-def update_and_draw_pop_effects(dt):
-    remove_list = []
+    screen.blit(chicken_sprite(chicken_id, rect.w, alpha, tint), rect)
 
+def draw_pop_effects():
+    # Fortschritt: pop_effects.update(dt) einmal pro Frame vor dem Zeichnen
     for eff in pop_effects:
-        eff["t"] += dt / 220.0  # Animation dauert ca. 0.22s
-
-        t = eff["t"]
-        if t >= 1.0:
-            remove_list.append(eff)
+        # Position berechnen (außerhalb des Ausschnitts: nicht zeichnen)
+        if not view.contains(eff.x, eff.y):
             continue
+        px, py = view.tile_pos(eff.x, eff.y)
 
-        # Position berechnen
-        px = PADDING + eff["x"] * TILE_SIZE
-        py = PADDING + eff["y"] * TILE_SIZE
-
-        # Animation: größer -> kleiner + fade
-        scale = 1.0 + (0.25 * (1 - t))        # Start bei 1.25, Ende 1.0
-        alpha = int(255 * (1 - t))           # Fade-out
-        angle = (t * 25) - 12                # Rotation
-
-        img = pygame.transform.rotozoom(eff["img"], angle, scale)
-        img.set_alpha(alpha)
+        # Animation: vorberechnetes Einzelbild für den aktuellen Fortschritt
+        img = pop_frames(eff.c, eff.size)[frame_index(eff.t)]
 
         # zentriert zeichnen
         rect = img.get_rect(center=(
-            px + TILE_SIZE // 2,
-            py + TILE_SIZE // 2
+            px + view.tile // 2,
+            py + view.tile // 2
         ))
 
         screen.blit(img, rect.topleft)
 
-    # fertige Effekte entfernen
-    for eff in remove_list:
-        pop_effects.remove(eff)
 
+# Vollbild-Overlays werden einmal pro Bildschirmgröße gebaut und danach nur geblittet;
+# bei Größenänderung des Fensters wird der Cache geleert.
+overlay_cache = LRUCache(maxsize=16)
 
-def draw_overlay(title, subtitle=None, color=ACCENT, bg_style="fancy"):
+def overlay_background(bg_style, size):
     """
     bg_style: 'fancy' -> gradient / painted background; 'solid' -> dark translucent
     """
-    if bg_style == "fancy":
-        # radialer hintergrund
-        overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        for i in range(160, 0, -8):
-            alpha = int(180 * (i / 160))
-            radius = int(max(SCREEN_W, SCREEN_H) * (i / 160))
-            pygame.draw.circle(overlay, (20, 30, 40, alpha), (SCREEN_W//2, SCREEN_H//2), radius)
-        screen.blit(overlay, (0,0))
-    else:
-        overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        overlay.fill((0,0,0,180))
-        screen.blit(overlay, (0,0))
+    def build():
+        w, h = size
+        overlay = pygame.Surface(size, pygame.SRCALPHA)
+        if bg_style == "fancy":
+            # radialer hintergrund
+            for i in range(160, 0, -8):
+                alpha = int(180 * (i / 160))
+                radius = int(max(w, h) * (i / 160))
+                pygame.draw.circle(overlay, (20, 30, 40, alpha), (w//2, h//2), radius)
+        else:
+            overlay.fill((0,0,0,180))
+        return overlay
+    return overlay_cache.get(("bg", bg_style, size), build)
 
-    # rahmen
-    panel_w, panel_h = SCREEN_W * 0.8, 220
-    panel = pygame.Rect((SCREEN_W - panel_w)//2, (SCREEN_H - panel_h)//2 - 20, panel_w, panel_h)
-    pygame.draw.rect(screen, PANEL, panel, border_radius=18)
-    pygame.draw.rect(screen, (40,40,50), panel, 4, border_radius=18)
 
-    # Titel und Untertitel
-    title_surf = font_big.render(title, True, color)
-    screen.blit(title_surf, title_surf.get_rect(center=(SCREEN_W//2, panel.centery - 20)))
-    if subtitle:
-        sub = font.render(subtitle, True, WHITE)
-        screen.blit(sub, sub.get_rect(center=(SCREEN_W//2, panel.centery + 34)))
+def draw_overlay(title, subtitle=None, color=ACCENT, bg_style="fancy"):
+    """Hintergrund, Rahmen und Texte als ein fertiges Overlay (gecacht) blitten."""
+    size = screen.get_size()
 
+    def build():
+        w, h = size
+        overlay = overlay_background(bg_style, size).copy()
 
-def draw_about():
-    overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-    overlay.fill((0,0,0,180))  # dunkler, halbtransparenter Hintergrund
-    screen.blit(overlay, (0,0))
+        # rahmen
+        panel_w, panel_h = w * 0.8, 220
+        panel = pygame.Rect((w - panel_w)//2, (h - panel_h)//2 - 20, panel_w, panel_h)
+        pygame.draw.rect(overlay, PANEL, panel, border_radius=18)
+        pygame.draw.rect(overlay, (40,40,50), panel, 4, border_radius=18)
 
-    panel_w, panel_h = SCREEN_W * 0.85, 240
-    panel = pygame.Rect((SCREEN_W - panel_w)//2, (SCREEN_H - panel_h)//2, panel_w, panel_h)
-    pygame.draw.rect(screen, PANEL, panel, border_radius=18)
-    pygame.draw.rect(screen, (61, 32, 42), panel, 4, border_radius=18)
+        # Titel und Untertitel
+        title_surf = render_text(font_big, title, color)
+        overlay.blit(title_surf, title_surf.get_rect(center=(w//2, panel.centery - 20)))
+        if subtitle:
+            sub = render_text(font, subtitle, WHITE)
+            overlay.blit(sub, sub.get_rect(center=(w//2, panel.centery + 34)))
+        return overlay
 
-    lines = [
-        "Sort the CHICKENS! 🐔",
-        "von Amiga4ever",
-        "Sortiere mind. 3 gleiche Hühner",
-        "Beitrag zum Hackathon 3.0 © 2025"
-    ]
+    screen.blit(overlay_cache.get(("overlay", title, subtitle, color, bg_style, size), build), (0,0))
 
-    # Jede Zeile zentrieren
-    for i, text in enumerate(lines):
-        surf = font_big.render(text, True, ACCENT if i==0 else WHITE)
-        line_y = panel.top + 30 + i * 50  # Abstand zwischen Zeilen
-        screen.blit(surf, surf.get_rect(center=(SCREEN_W//2, line_y)))
+
+def draw_about():
+    """Der komplette Über-Bildschirm (Hintergrund, Panel, Hinweis) als ein Bild."""
+    size = screen.get_size()
+
+    def build():
+        w, h = size
+        surf = pygame.Surface(size).convert()
+        surf.blit(menu_bg, (0,0))
+        surf.blit(overlay_background("solid", size), (0,0))  # dunkler, halbtransparenter Hintergrund
+
+        panel_w, panel_h = w * 0.85, 240
+        panel = pygame.Rect((w - panel_w)//2, (h - panel_h)//2, panel_w, panel_h)
+        pygame.draw.rect(surf, PANEL, panel, border_radius=18)
+        pygame.draw.rect(surf, (61, 32, 42), panel, 4, border_radius=18)
+
+        lines = [
+            "Sort the CHICKENS! 🐔",
+            "von Amiga4ever",
+            "Sortiere mind. 3 gleiche Hühner",
+            "Beitrag zum Hackathon 3.0 © 2025"
+        ]
+
+        # Jede Zeile zentrieren
+        for i, text in enumerate(lines):
+            line = render_text(font_big, text, ACCENT if i==0 else WHITE)
+            line_y = panel.top + 30 + i * 50  # Abstand zwischen Zeilen
+            surf.blit(line, line.get_rect(center=(w//2, line_y)))
+
+        # Zurück ins Hauptmenü
+        hint = render_text(font, "Drücke [Q] für Hauptmenü", WHITE)
+        surf.blit(hint, hint.get_rect(center=(w//2, h-60)))
+        return surf
+
+    screen.blit(overlay_cache.get(("about", size), build), (0,0))
+
+LEVEL_NAMES = {128: "Easy", 256: "Medium", 512: "Hardcore"}
+
+def leaderboard_surface(level):
+    """Titel, Bestenliste und Hinweis als ein Bild; neu gebaut nur wenn sich die Scores ändern."""
+    scores = cached_scores(level)  # kein Datei-Zugriff im Normalfall
+    size = screen.get_size()
+
+    def build():
+        w, h = size
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        title = render_text(font_title, "Highscores", ACCENT)
+        surf.blit(title, title.get_rect(center=(w//2, 80)))
+        sub = render_text(font, f"< {LEVEL_NAMES.get(level, level)} — {level} Hühner >", GREY)
+        surf.blit(sub, sub.get_rect(center=(w//2, 120)))
+        start_y = 160
+        for i, entry in enumerate(scores):
+            line = f"{i+1}. {entry['name']} — {entry['score']}"
+            if entry.get("moves"):
+                line += f"  ({entry['moves']} Züge)"
+            txt = render_text(font, line, WHITE)
+            surf.blit(txt, txt.get_rect(center=(w//2, start_y + i*30)))
+        hint = render_text(font, "Drücke [Q] für Hauptmenü, Pfeiltasten für Stufe", WHITE)
+        surf.blit(hint, hint.get_rect(center=(w//2, h-60)))
+        return surf
+
+    return overlay_cache.get(("leaderboard", level, scores_version(), size), build)
 
 
 # ----------------------------
@@ -433,37 +734,141 @@ btn_mid  = pygame.Rect((SCREEN_W//2 - btn_w//2, 290, btn_w, btn_h))
 btn_hard = pygame.Rect((SCREEN_W//2 - btn_w//2, 360, btn_w, btn_h))
 btn_highscore = pygame.Rect((SCREEN_W//2 - btn_w//2, 430, btn_w, btn_h))
 btn_about = pygame.Rect(SCREEN_W - 120, 20, 100, 40)  # kleine Ecke oben rechts
+btn_resume = pygame.Rect(20, 20, 170, 40)  # nur mit gespeichertem Spiel
 
 
 # ----------------------------
 # Main loop
 # ----------------------------
 
-current_pair = new_pair()
+# heiße Funktionen für den Profiler umhüllen (bei ausgeschaltetem Profiler nur eine Abfrage)
+draw_game = prof.wrap(draw_game, "draw_game")
+draw_chicken = prof.wrap(draw_chicken, "draw_chicken")
+draw_pop_effects = prof.wrap(draw_pop_effects, "draw_pop_effects")
+draw_overlay = prof.wrap(draw_overlay, "draw_overlay")
+font_render = prof.wrap(font_render, "font.render")
+place_pair = prof.wrap(place_pair, "place_pair")
+for board_cls in BOARDS.values():
+    prof.instrument(board_cls, "find_matches")
+    prof.instrument(board_cls, "matches_around")
+prof.instrument(HintEngine, "step")
+
 running = True
 music_on = True
 name_input = ""
 entering_name = False
+drawn_state = None  # Zustand des zuletzt gezeichneten Frames
+highscore_level = GOAL_CHICKENS  # angezeigte Bestenliste
+startup_reported = False
+
 
+def animating():
+    """True, solange sich ohne Eingabe etwas bewegt oder rechnet (dann volle Bildrate)."""
+    if state == "menu":  # Titel-Animation
+        return True
+    if len(pop_effects):
+        return True
+    # Tipp-Suche rechnet in Zeitscheiben pro Frame
+    return state == "playing" and hint_on and not hints.done
 
+
+def idle_timeout():
+    return 250 if prof.enabled else IDLE_TIMEOUT_MS  # Profiler-Anzeige alle 250 ms
+
+
+def wait_events(deadline, frame_due):
+    """Sammelt Events bis ``deadline`` (perf_counter) als [(Empfangszeit, Event)].
+
+    Klicks und Tasten beenden das Warten sofort, damit ihr Ergebnis ohne
+    Frame-Schlaf auf den Bildschirm kommt; andere Events (Mausbewegung) ziehen das
+    Ende höchstens auf den nächsten Frametakt ``frame_due`` vor.
+    """
+    events = []
+    while True:
+        timeout = int((deadline - time.perf_counter()) * 1000)
+        if timeout <= 0:
+            break
+        event = pygame.event.wait(timeout)
+        if event.type == pygame.NOEVENT:
+            break
+        events.append((time.perf_counter(), event))
+        if event.type in URGENT_EVENTS:
+            break
+        deadline = min(deadline, frame_due)
+    now = time.perf_counter()
+    events.extend((now, event) for event in pygame.event.get())
+    return events
+
+
+def report_startup():
+    """Gibt die Startphasen und die Zeit bis zum ersten Frame aus (--startup-time)."""
+    mark_startup("erster Frame")
+    last = 0.0
+    print("Start:")
+    for phase, t in startup_marks:
+        print(f"  {phase:<14} {t*1000:8.1f} ms  (+{(t-last)*1000:.1f})")
+        last = t
+    # auf die Hintergrund-Assets warten, damit auch deren Ende gemessen wird
+    preload.get("chickens")
+    for name in SOUND_FILES:
+        preload.get(("sound", name))
+    if preload.finished_at is not None:
+        print(f"  {'Assets fertig':<14} {(preload.finished_at - STARTUP_T0)*1000:8.1f} ms")
+    print(f"  Font: {FONT_PATH or 'pygame-Standard'}")
+
+
+frame_start = time.perf_counter()
 while running:
-    dt = clock.tick(FPS)
+    prof.start_frame(state)
+    # bis zum nächsten Frametakt warten – oder, wenn nichts läuft, bis Eingabe oder Timer
+    frame_due = frame_start + 1 / FPS
+    idle = IDLE_WAIT and not animating()
+    events = wait_events(frame_start + idle_timeout() / 1000 if idle else frame_due, frame_due)
+    now = time.perf_counter()
+    dt = (now - frame_start) * 1000
+    if idle:
+        dt = min(dt, 1000 / FPS)  # Wartezeit nicht in Animationen durchreichen
+    frame_start = now
+    prof.lap("wait")
     mouse_pos = pygame.mouse.get_pos()
-    mouse_pressed = pygame.mouse.get_pressed()[0]
 
     # --- Event-Loop: nur einmal pro Frame ---
-    for event in pygame.event.get():
+    for received, event in events:
+        # Beginn eines Drucks: Klick, oder Touchpads, die nur Bewegung mit gedrückter Taste melden
+        press = False
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            press = not mouse_held
+            mouse_held = True
+        elif event.type == pygame.MOUSEMOTION:
+            press = bool(event.buttons[0]) and not mouse_held
+            mouse_held = bool(event.buttons[0])
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            mouse_held = False
+
         if event.type == pygame.QUIT:
             running = False
+        elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            dirty.mark_full()  # Fensterinhalt verloren, alles neu
+        elif event.type in (pygame.VIDEORESIZE, pygame.WINDOWSIZECHANGED):
+            overlay_cache.clear()  # Overlays passen nicht mehr zur Fenstergröße
+            dirty.mark_full()
 
         # Globale Tastatur
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 if state == "playing":
+                    flush_save()
                     state = "menu"
                 else:
                     running = False
+            elif event.key == pygame.K_F2:  # Dirty-Rect-Anzeige
+                DEBUG_DIRTY = not DEBUG_DIRTY
+                dirty.mark_full()
+            elif event.key == pygame.K_F3:  # Profiler
+                prof.toggle()
+                dirty.mark_full()
             elif event.key == pygame.K_m:  # Musik an/aus
+                dirty.mark_full()
                 music_on = not music_on
                 if music_on and menu_music:
                     pygame.mixer.music.play(-1)
@@ -477,6 +882,7 @@ while running:
                 elif btn_mid.collidepoint(event.pos): start_game(256)
                 elif btn_hard.collidepoint(event.pos): start_game(512)
                 elif btn_highscore.collidepoint(event.pos): state = "highscore"
+                elif saved_game and btn_resume.collidepoint(event.pos): resume_game()
                 if btn_about.collidepoint(event.pos):
                     state = "about"
 
@@ -485,44 +891,39 @@ while running:
                 elif event.key == pygame.K_m: start_game(256)
                 elif event.key == pygame.K_h: start_game(512)
                 elif event.key == pygame.K_s: state = "highscore"
+                elif event.key == pygame.K_f and saved_game: resume_game()
 
         elif state == "playing":
-            triggered = False
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                triggered = True
-            elif event.type == pygame.MOUSEMOTION and mouse_pressed and not mouse_was_pressed:
-                triggered = True
-
-            if triggered:
-                mx, my = pygame.mouse.get_pos()
-                gx = (mx - PADDING) // TILE_SIZE
-                gy = (my - PADDING) // TILE_SIZE
-                if 0 <= gx < GRID_W and 0 <= gy < GRID_H and can_place(gx, gy, current_pair[0]):
-                    current_time = pygame.time.get_ticks()
-                    if triggered and current_time - last_place_time > 100:  # 100ms Sperre
-                            place_pair(gx, gy, current_pair[0])
-                            last_place_time = current_time
-                            moves += 1
-                            current_pair = next_pair
-                            next_pair = new_pair()
-
-                    if rescued >= GOAL_CHICKENS:
+            if press:
+                cell = view.to_grid(*event.pos)  # Position des Events, nicht die aktuelle Maus
+                if cell is not None and place_pair(*cell):
+                    latency.input(received)
+                    if game.state == "victory":
                         state = "victory"
                         name_input = ""
                         entering_name = False
-                        if sounds["victory"]: sounds["victory"].play()
-                    elif not any_move_possible(current_pair[0]):
+                        play_sound("victory")
+                    elif game.state == "gameover":
                         state = "gameover"
 
-            mouse_was_pressed = mouse_pressed
-
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_r:
                     reset_game_to_menu()
+                elif event.key == pygame.K_t: hint_on = not hint_on  # Tipp an/aus
+                # große Bretter: Ausschnitt mit den Pfeiltasten um eine halbe Seite verschieben
+                elif event.key == pygame.K_LEFT: view.scroll(-max(1, view.cols // 2), 0)
+                elif event.key == pygame.K_RIGHT: view.scroll(max(1, view.cols // 2), 0)
+                elif event.key == pygame.K_UP: view.scroll(0, -max(1, view.rows // 2))
+                elif event.key == pygame.K_DOWN: view.scroll(0, max(1, view.rows // 2))
+                dirty.mark_full()
+            # Mausrad zoomt um den Mauszeiger
+            if event.type == pygame.MOUSEWHEEL and event.y:
+                view.zoom(-1 if event.y > 0 else 1, pygame.mouse.get_pos())
+                dirty.mark_full()
 
         elif state == "gameover":
             if not gameover_played:
-                if sounds["gameover"]: sounds["gameover"].play()
+                play_sound("gameover")
                 gameover_played = True
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_r:
@@ -530,7 +931,7 @@ while running:
 
         elif state == "victory":
             if not victory_played:
-                if sounds["victory"]: sounds["victory"].play()
+                play_sound("victory")
                 victory_played = True
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_RETURN:
@@ -543,7 +944,8 @@ while running:
         elif state == "enter_name" and entering_name:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_RETURN and name_input.strip():
-                    add_score(name_input.strip(), rescued)
+                    add_score(name_input.strip(), game.rescued, difficulty=game.goal, moves=game.moves)
+                    highscore_level = game.goal
                     state = "highscore"
                     entering_name = False
                 elif event.key == pygame.K_BACKSPACE:
@@ -554,6 +956,9 @@ while running:
         elif state == "highscore":
             if event.type == pygame.KEYDOWN and event.key == pygame.K_q:
                 state = "menu"
+            elif event.type == pygame.KEYDOWN and event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                i = DIFFICULTIES.index(highscore_level) + (1 if event.key == pygame.K_RIGHT else -1)
+                highscore_level = DIFFICULTIES[i % len(DIFFICULTIES)]
 
             # Innerhalb des Event-Loops, zusammen mit den anderen state-Abfragen
         elif state == "about":
@@ -561,7 +966,13 @@ while running:
                 state = "menu"
 
 
+    prof.lap("events")
+
     # --- State Drawing ---
+    if state != drawn_state:
+        dirty.mark_full()  # neuer Bildschirm: komplett zeichnen
+        drawn_state = state
+
     if state == "menu":
         screen.blit(menu_bg, (0, 0))
 
@@ -581,7 +992,7 @@ while running:
         float_y = 120 + math.sin(title_anim_time) * 6
 
         # Titel 
-        title = font_title.render("Sort the CHICKENS!", True, ACCENT)
+        title = render_text(font_title, "Sort the CHICKENS!", ACCENT)
         title_rect = title.get_rect(center=(SCREEN_W//2, float_y))
         screen.blit(title, title_rect)
 
@@ -615,27 +1026,28 @@ while running:
         draw_button(btn_hard, "Hardcore — 512 Hühner", btn_hard.collidepoint((mx,my)))
         draw_button(btn_highscore, "Highscores", btn_highscore.collidepoint(mouse_pos))
         draw_button(btn_about, "Über …", btn_about.collidepoint(mouse_pos))
+        if saved_game:
+            draw_button(btn_resume, "Fortsetzen (F)", btn_resume.collidepoint(mouse_pos))
 
         # text unter buttons
-        hint = font.render("Wähle per Klick oder Taste: E / M / H / S", True, WHITE)
+        hint = render_text(font, "Wähle per Klick oder Taste: E / M / H / S", WHITE)
         screen.blit(hint, hint.get_rect(center=(SCREEN_W//2, 520)))
 
     elif state == "playing":
-        draw_game()
-        base_x = GRID_W*TILE_SIZE + PADDING*2 + 20
-        base_y = PADDING + 125
-        label_hint = font.render(f"Musik: {'AN' if music_on else 'AUS'}  (Taste M)", True, GREY)
-        screen.blit(label_hint, (base_x, base_y + 70))
+        render_playing(dt)  # überträgt selbst (Dirty Rects)
 
     elif state == "gameover":
+        pop_effects.update(dt)
         draw_game()
         draw_overlay("GAME OVER", "Drücke [R] zum Neustart", color=RED, bg_style="fancy")
 
     elif state == "victory":
+        pop_effects.update(dt)
         draw_game()
         draw_overlay("Alle Hühner ordentlich sortiert!", "Drücke [Enter] für Highscore", color=ACCENT, bg_style="fancy")
 
     elif state == "enter_name":
+        pop_effects.update(dt)
         draw_game()
         draw_overlay("Gib deinen Namen ein:", f"Name: {name_input}", color=ACCENT)
 
@@ -647,30 +1059,47 @@ while running:
                 pygame.mixer.music.set_volume(0.45)
                 pygame.mixer.music.play(-1)
             except Exception: pass
-        title = font_title.render("Highscores", True, ACCENT)
-        screen.blit(title, title.get_rect(center=(SCREEN_W//2, 80)))
-        scores = load_scores()
-        start_y = 150
-        for i, entry in enumerate(scores):
-            txt = font.render(f"{i+1}. {entry['name']} — {entry['score']}", True, WHITE)
-            screen.blit(txt, txt.get_rect(center=(SCREEN_W//2, start_y + i*30)))
-        hint = font.render("Drücke [Q] für Hauptmenü", True, WHITE)
-        screen.blit(hint, hint.get_rect(center=(SCREEN_W//2, SCREEN_H-60)))
+        screen.blit(leaderboard_surface(highscore_level), (0,0))
 
     
     elif state == "about":
-        screen.blit(menu_bg, (0,0))
-        draw_about()
-
-        # Zurück ins Hauptmenü
-        hint = font.render("Drücke [Q] für Hauptmenü", True, WHITE)
-        screen.blit(hint, hint.get_rect(center=(SCREEN_W//2, SCREEN_H-60)))
+        draw_about()  # Hintergrund, Panel und Hinweis in einem Blit
 
         if event.type == pygame.KEYDOWN and event.key == pygame.K_q:
             state = "menu"
 
 
-    pygame.display.flip()
+    if state != "playing":
+        if prof.enabled:
+            draw_profile_overlay()
+        prof.lap("draw")
+        pygame.display.flip()
+        latency.presented()
+        prof.lap("present")
+    prof.end_frame()
+
+    if STARTUP_PROBE and not startup_reported:
+        report_startup()
+        startup_reported = True
+        if "--startup-time" in sys.argv:
+            running = False
 
+preload.shutdown()
+flush_save()
+if prof.trace:
+    try:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        paths = prof.dump(dump_base(DATA_DIR, "profile"))
+        print("Profil gespeichert:", *paths)
+    except OSError as e:
+        print("Warnung: Profil konnte nicht gespeichert werden:", e)
+if latency.samples:
+    print("\n".join(latency.report_lines(1000 / FPS)))
+    try:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        print("Latenz gespeichert:", latency.dump(dump_base(DATA_DIR, "latency") + ".json", 1000 / FPS))
+    except OSError as e:
+        print("Warnung: Latenz konnte nicht gespeichert werden:", e)
+flush_scores()  # fehlgeschlagene Einträge ein letztes Mal versuchen
 pygame.quit()
 sys.exit()
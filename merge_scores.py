@@ -0,0 +1,208 @@
+"""Führt die Bestenlisten vieler Rechner zu einer globalen Top-K pro Stufe zusammen.
+
+Aufruf:
+  python merge_scores.py [-k 10] [--per-player] [--out merged.json|merged.db] PFAD...
+
+PFAD ist eine highscores.json, eine Score-Datenbank (highscores.db) oder ein
+Ordner, der rekursiv nach beiden durchsucht wird (z.B. eingesammelte
+``get_data_dir()``-Ordner, ein Unterordner pro Rechner).
+
+Jede Quelle liefert ihre Einträge einer Stufe bereits sortiert (SQLite über den
+Index, JSON durch Einlesen der Datei je Stufe, nur deren Einträge bleiben bis zum
+Verbrauch im Speicher); ``heapq.merge`` mischt sie und hört nach K Einträgen auf.
+Gleiche Einträge (Name, Score, Züge), etwa aus doppelt eingesammelten Dateien,
+zählen einmal. Unlesbare oder beschädigte Dateien werden mit Warnung übersprungen,
+einzelne unbrauchbare Einträge (fehlende Felder, keine Zahl) still ausgelassen.
+``--out`` schreibt immer eine neue Datei; eine vorhandene wird ersetzt.
+"""
+import argparse
+import heapq
+import itertools
+import json
+import os
+import sqlite3
+import sys
+import time
+
+from highscore import difficulty_for
+
+SQLITE_MAGIC = b"SQLite format 3\x00"
+
+
+def rank_key(entry):
+    """Sortierung wie in der Datenbank: Score absteigend, dann Züge (unbekannt zuerst)."""
+    _, score, moves = entry
+    return (-score, moves is not None, moves or 0)
+
+
+def warn_skipped(path, error):
+    print(f"Warnung: {path} übersprungen ({error}).", file=sys.stderr)
+
+
+class JSONSource:
+    """Eine highscores.json (altes oder neues Format); hält zwischen den Stufen nichts im Speicher."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def _entries(self):
+        """(Stufe, Eintrag) für jeden gültigen Eintrag der Datei, bei jedem Aufruf neu gelesen."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            warn_skipped(self.path, e)
+            return
+        for e in data if isinstance(data, list) else []:
+            if not (isinstance(e, dict) and "name" in e and "score" in e):
+                continue
+            try:
+                score = int(e["score"])
+                moves = e.get("moves")
+                moves = None if moves is None else int(moves)
+                level = int(e.get("difficulty") or difficulty_for(score))
+            except (TypeError, ValueError):
+                continue
+            yield level, (str(e["name"]), score, moves)
+
+    def difficulties(self):
+        return {level for level, _ in self._entries()}
+
+    def stream(self, difficulty):
+        entries = [e for level, e in self._entries() if level == difficulty]
+        entries.sort(key=rank_key)
+        entries.reverse()
+        while entries:  # von hinten abbauen: Verbrauchtes wird sofort frei
+            yield entries.pop()
+
+    def close(self):
+        pass
+
+
+class SQLiteSource:
+    """Eine Score-Datenbank von SQLiteScoreStore, nur lesend geöffnet."""
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            self.conn.execute("SELECT 1 FROM scores LIMIT 1").fetchall()  # kaputte Dateien gleich erkennen
+        except sqlite3.DatabaseError:
+            self.conn.close()
+            raise
+
+    def difficulties(self):
+        try:
+            return {d for (d,) in self.conn.execute("SELECT DISTINCT difficulty FROM scores")}
+        except sqlite3.DatabaseError as e:
+            warn_skipped(self.path, e)
+            return set()
+
+    def stream(self, difficulty):
+        # Cursor liefert zeilenweise entlang des Index scores_rank
+        try:
+            yield from self.conn.execute(
+                "SELECT name, score, moves FROM scores WHERE difficulty = ? "
+                "ORDER BY score DESC, moves, id", (difficulty,))
+        except sqlite3.DatabaseError as e:  # beschädigte Datei: Rest dieser Quelle auslassen
+            warn_skipped(self.path, e)
+
+    def close(self):
+        self.conn.close()
+
+
+def open_source(path):
+    with open(path, "rb") as f:
+        is_db = f.read(len(SQLITE_MAGIC)) == SQLITE_MAGIC
+    return SQLiteSource(path) if is_db else JSONSource(path)
+
+
+def find_sources(paths):
+    """Dateien zu den Pfaden; Ordner werden nach highscores.json und *.db durchsucht."""
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in sorted(files):
+                    if name == "highscores.json" or name.endswith(".db"):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def merge_top(sources, difficulty, k, per_player=False):
+    """Globale Top-K einer Stufe über alle Quellen (k-Wege-Merge, bricht nach K ab)."""
+    merged = heapq.merge(*(s.stream(difficulty) for s in sources), key=rank_key)
+    out = []
+    players = set()
+    # gleiche Einträge haben denselben Schlüssel, Duplikate also nur innerhalb einer Gruppe
+    for _, group in itertools.groupby(merged, key=rank_key):
+        seen = set()
+        for entry in group:
+            if entry in seen:
+                continue
+            seen.add(entry)
+            if per_player:
+                if entry[0] in players:
+                    continue
+                players.add(entry[0])
+            out.append(entry)
+            if len(out) >= k:
+                return out
+    return out
+
+
+def write_output(path, tops):
+    if path.endswith(".db"):
+        from score_db import SQLiteScoreStore
+        # frische Datenbank: ein zweiter Lauf soll nicht an das alte Ergebnis anhängen
+        for stale in (path, path + "-wal", path + "-shm", path + "-journal"):
+            if os.path.exists(stale):
+                os.remove(stale)
+        store = SQLiteScoreStore(path)
+        store.add_many([(n, s, d, m) for d, entries in tops.items() for n, s, m in entries])
+        store.close()
+    else:
+        data = [{"name": n, "score": s, "difficulty": d, "moves": m}
+                for d, entries in tops.items() for n, s, m in entries]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("paths", nargs="+", help="highscores.json, *.db oder Ordner")
+    ap.add_argument("-k", type=int, default=10, help="Einträge pro Stufe (Standard 10)")
+    ap.add_argument("--per-player", action="store_true", help="nur der beste Eintrag je Name")
+    ap.add_argument("--difficulty", type=int, action="append", help="nur diese Stufe(n)")
+    ap.add_argument("--out", help="Ergebnis als .json oder .db schreiben")
+    args = ap.parse_args()
+
+    t = time.perf_counter()
+    sources = []
+    for path in find_sources(args.paths):
+        try:
+            sources.append(open_source(path))
+        except (OSError, sqlite3.DatabaseError) as e:
+            warn_skipped(path, e)
+    levels = set(args.difficulty or ())
+    if not levels:
+        for s in sources:
+            levels |= s.difficulties()
+
+    tops = {}
+    for level in sorted(levels):
+        tops[level] = merge_top(sources, level, args.k, args.per_player)
+    for s in sources:
+        s.close()
+
+    if args.out:
+        write_output(args.out, tops)
+    for level, entries in tops.items():
+        print(f"== {level} ==")
+        for i, (name, score, moves) in enumerate(entries):
+            print(f"{i+1:>3}. {name} — {score}" + (f" ({moves} Züge)" if moves is not None else ""))
+    print(f"{len(sources)} Quellen, {time.perf_counter() - t:.2f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
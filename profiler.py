@@ -0,0 +1,206 @@
+"""Frame-Profiler: Zeit pro Phase, Aufrufe heißer Funktionen, Perzentile und Trace-Dateien (ohne pygame).
+
+Einschalten mit CHICKENS_PROFILE=1 oder zur Laufzeit (F3 in main.py). Der Frame
+wird in Runden gemessen: ``start_frame`` am Anfang, ``lap(phase)`` nach jedem
+Abschnitt (Zeit seit dem letzten ``lap``), ``end_frame`` am Ende. Funktionen,
+die mit ``wrap``/``instrument`` umhüllt sind, zählen Aufrufe und Zeit; solange
+der Profiler aus ist, kostet die Hülle nur eine Abfrage.
+
+``dump`` schreibt die Frames als CSV (eine Zeile pro Frame) und eine
+Zusammenfassung mit Perzentilen als JSON.
+
+``LatencyProbe`` misst die Zeit von einer Eingabe bis zum Display-Update, das
+ihr Ergebnis zeigt, und sammelt sie als Histogramm.
+"""
+import csv
+import functools
+import json
+import os
+import time
+from collections import deque
+
+PERCENTILES = (50, 95, 99)
+TRACE_FRAMES = 36_000  # Frames im Trace (10 Minuten bei 60 FPS), ältere fallen heraus
+
+
+def percentile(values, p):
+    """p-Perzentil (Nearest-Rank) einer unsortierten Liste, 0.0 wenn leer."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = max(0, min(len(ordered) - 1, -(-p * len(ordered) // 100) - 1))
+    return ordered[k]
+
+
+def dump_base(folder, prefix):
+    """Dateiname ohne Endung mit Zeit auf die Millisekunde und PID, damit sich Dumps nie überschreiben."""
+    t = time.time()
+    stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(t))
+    return os.path.join(folder, f"{prefix}-{stamp}-{int(t * 1000) % 1000:03d}-{os.getpid()}")
+
+
+class Profiler:
+    def __init__(self, enabled=False, window=240, trace_frames=TRACE_FRAMES):
+        self.enabled = enabled
+        self.window = window  # Frames für die Live-Perzentile
+        # (frame, start_ms, label, {phase: ms}, {name: aufrufe}), Ringpuffer der letzten Frames
+        self.trace = deque(maxlen=trace_frames)
+        self.recent = {}      # phase -> deque der letzten ms-Werte ("frame" = Summe)
+        self.calls = {}       # name -> [aufrufe, sekunden] seit Start
+        self.frame = 0
+        self._t0 = time.perf_counter()
+        self._start = None    # Beginn des laufenden Frames (None = kein Frame offen)
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self._start = None
+
+    # --- Phasen ---
+    def start_frame(self, label=""):
+        if not self.enabled:
+            return
+        self._start = self._last = time.perf_counter()
+        self._label = label
+        self._phases = {}
+        self._calls = {}
+
+    def lap(self, phase):
+        if self._start is None:
+            return
+        now = time.perf_counter()
+        self._phases[phase] = self._phases.get(phase, 0.0) + (now - self._last) * 1000
+        self._last = now
+
+    def end_frame(self):
+        if self._start is None:
+            return
+        total = (self._last - self._start) * 1000
+        self.frame += 1
+        self.trace.append((self.frame, (self._start - self._t0) * 1000, self._label,
+                           self._phases, self._calls))
+        for phase, ms in list(self._phases.items()) + [("frame", total)]:
+            q = self.recent.get(phase)
+            if q is None:
+                q = self.recent[phase] = deque(maxlen=self.window)
+            q.append(ms)
+        self._start = None
+
+    # --- heiße Funktionen ---
+    def wrap(self, fn, name=None):
+        """Hülle um ``fn``, die bei eingeschaltetem Profiler Aufrufe und Zeit zählt."""
+        name = name or fn.__qualname__
+        stats = self.calls.setdefault(name, [0, 0.0])
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not self.enabled:
+                return fn(*args, **kwargs)
+            t = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                stats[0] += 1
+                stats[1] += time.perf_counter() - t
+                if self._start is not None:
+                    self._calls[name] = self._calls.get(name, 0) + 1
+
+        return wrapper
+
+    def instrument(self, owner, attr, name=None):
+        """Ersetzt ``owner.attr`` (Klasse oder Modul) durch eine zählende Hülle."""
+        fn = getattr(owner, attr)
+        setattr(owner, attr, self.wrap(fn, name or f"{getattr(owner, '__name__', owner)}.{attr}"))
+
+    # --- Auswertung ---
+    def summary(self):
+        phases = {}
+        for phase, q in self.recent.items():
+            values = list(q)
+            phases[phase] = {f"p{p}": round(percentile(values, p), 3) for p in PERCENTILES}
+            phases[phase]["max"] = round(max(values), 3)
+        frames = max(self.frame, 1)  # Aufrufzähler laufen seit Start, nicht nur über den Trace
+        calls = {name: {"calls": n, "ms": round(s * 1000, 3), "calls_per_frame": round(n / frames, 2)}
+                 for name, (n, s) in self.calls.items() if n}
+        return {"frames": self.frame, "traced": len(self.trace), "window": self.window, "phases": phases, "calls": calls}
+
+    def overlay_lines(self):
+        """Textzeilen für die Live-Anzeige."""
+        summary = self.summary()
+        lines = [f"Profil (F3)  {self.frame} Frames    p50 / p95 / p99 ms"]
+        phases = summary["phases"]
+        for phase in sorted(phases, key=lambda ph: ph == "frame"):
+            s = phases[phase]
+            lines.append(f"{phase:<9} {s['p50']:7.2f} {s['p95']:7.2f} {s['p99']:7.2f}")
+        hot = sorted(summary["calls"].items(), key=lambda kv: -kv[1]["ms"])[:5]
+        for name, s in hot:
+            lines.append(f"{name:<24} {s['calls_per_frame']:7.1f}/Frame  {s['ms'] / max(s['calls'], 1) * 1000:6.1f} µs")
+        return lines
+
+    def dump(self, base):
+        """Schreibt ``base.csv`` (Frames) und ``base.json`` (Zusammenfassung); gibt die Pfade zurück."""
+        phases = sorted({ph for _, _, _, p, _ in self.trace for ph in p})
+        names = sorted({n for _, _, _, _, c in self.trace for n in c})
+        csv_path, json_path = base + ".csv", base + ".json"
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(["frame", "start_ms", "state"] + [f"{ph}_ms" for ph in phases] + ["total_ms"] + names)
+            for frame, start, label, p, c in self.trace:
+                w.writerow([frame, f"{start:.3f}", label]
+                           + [f"{p.get(ph, 0.0):.3f}" for ph in phases]
+                           + [f"{sum(p.values()):.3f}"] + [c.get(n, 0) for n in names])
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, indent=2)
+        return csv_path, json_path
+
+
+class LatencyProbe:
+    """Eingabe-bis-Bild-Latenz: ``input(t)`` beim Verarbeiten, ``presented()`` nach flip/update."""
+
+    def __init__(self, enabled=False, bucket_ms=1.0, buckets=50):
+        self.enabled = enabled
+        self.bucket_ms = bucket_ms
+        self.counts = [0] * buckets  # letzter Eimer sammelt alles darüber
+        self.samples = []
+        self._pending = []  # Eingabezeitpunkte, deren Ergebnis noch nicht angezeigt wurde
+
+    def input(self, t):
+        """Eingabe zum Zeitpunkt ``t`` (perf_counter) hat den Zustand geändert."""
+        if self.enabled:
+            self._pending.append(t)
+
+    def presented(self):
+        if not self._pending:
+            return
+        now = time.perf_counter()
+        for t in self._pending:
+            ms = (now - t) * 1000
+            self.samples.append(ms)
+            self.counts[min(int(ms / self.bucket_ms), len(self.counts) - 1)] += 1
+        self._pending.clear()
+
+    def summary(self, frame_ms):
+        values = self.samples
+        out = {"samples": len(values), "frame_ms": round(frame_ms, 3),
+               "within_frame": round(sum(v <= frame_ms for v in values) / max(len(values), 1), 4),
+               "max": round(max(values, default=0.0), 3),
+               "bucket_ms": self.bucket_ms, "histogram": self.counts}
+        for p in PERCENTILES:
+            out[f"p{p}"] = round(percentile(values, p), 3)
+        return out
+
+    def report_lines(self, frame_ms, width=40):
+        s = self.summary(frame_ms)
+        lines = [f"Eingabe bis Bild: {s['samples']} Platzierungen, p50 {s['p50']:.1f} / p95 {s['p95']:.1f} / "
+                 f"p99 {s['p99']:.1f} ms, {s['within_frame']:.1%} innerhalb eines Frames ({frame_ms:.1f} ms)"]
+        top = max(self.counts) or 1
+        last = max((i for i, n in enumerate(self.counts) if n), default=-1)
+        for i in range(last + 1):
+            lo = i * self.bucket_ms
+            label = f">= {lo:g}" if i == len(self.counts) - 1 else f"{lo:g}-{lo + self.bucket_ms:g}"
+            lines.append(f"  {label:>8} ms {self.counts[i]:6d} {'#' * round(self.counts[i] / top * width)}")
+        return lines
+
+    def dump(self, path, frame_ms):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(dict(self.summary(frame_ms), values=[round(v, 3) for v in self.samples]), f, indent=2)
+        return path
@@ -0,0 +1,43 @@
+"""Caches für wiederverwendete Surfaces (Sprites, Texte, Hintergründe).
+
+Der Cache selbst kennt pygame nicht: er speichert, was ``build()`` liefert,
+und wirft bei Überlauf den am längsten nicht benutzten Eintrag raus.
+"""
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Begrenzter LRU-Cache mit Treffer-/Fehlzählern."""
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, build):
+        """Wert für ``key``; beim ersten Zugriff über ``build()`` erzeugt."""
+        data = self.data
+        try:
+            value = data[key]
+        except KeyError:
+            self.misses += 1
+            value = data[key] = build()
+            if len(data) > self.maxsize:
+                data.popitem(last=False)
+                self.evictions += 1
+            return value
+        self.hits += 1
+        data.move_to_end(key)
+        return value
+
+    def clear(self):
+        self.data.clear()
+
+    def __len__(self):
+        return len(self.data)
+
+    def stats(self):
+        return {"size": len(self.data), "hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions}
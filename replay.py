@@ -0,0 +1,146 @@
+"""Deterministische Replays: Seed, Stufe und gespielte Plätze reichen, um ein Spiel nachzuspielen.
+
+Ein Replay ist ein Binär-Datensatz:
+  Kopf ``HEADER`` (Magic, Version, Seed, Ziel, Brettgröße, Ergebnis: Zustand,
+  gerettete Hühner, Züge), danach 2 Byte (x, y) pro Zug.
+Eine Datei kann beliebig viele Datensätze hintereinander enthalten (Korpus).
+
+Aufruf:
+  python replay.py DATEI... [--board list|bitboard] [--repeat 1]
+      spielt alle Replays ohne Grafik so schnell wie möglich nach und prüft das Ergebnis
+  python replay.py --record 1000 --out korpus.rpl [--goal 256] [--size 6x6]
+      erzeugt einen Korpus aus Zufallsspielen (Seeds 0..N-1)
+"""
+import argparse
+import os
+import random
+import struct
+import sys
+import time
+
+from engine import Game, GRID_W, GRID_H, random_policy, play
+
+MAGIC = b"CHKR"
+VERSION = 1
+# Magic, Version, Zustand, Seed, Ziel, Breite, Höhe, gerettet, Züge
+HEADER = struct.Struct("<4sBBQIHHII")
+STATES = ("playing", "victory", "gameover")
+
+
+class Replay:
+    def __init__(self, seed, goal, width, height, placements, state="playing", rescued=0):
+        self.seed = seed
+        self.goal = goal
+        self.width = width
+        self.height = height
+        self.placements = placements  # [(x, y), ...]
+        self.state = state            # erwartetes Ergebnis
+        self.rescued = rescued
+
+    @classmethod
+    def from_game(cls, game):
+        return cls(game.seed, game.goal, game.width, game.height, list(game.placements),
+                   game.state, game.rescued)
+
+    @property
+    def moves(self):
+        return len(self.placements)
+
+    def to_bytes(self):
+        head = HEADER.pack(MAGIC, VERSION, STATES.index(self.state), self.seed, self.goal,
+                           self.width, self.height, self.rescued, self.moves)
+        return head + bytes(v for xy in self.placements for v in xy)
+
+    @classmethod
+    def from_bytes(cls, data, offset=0):
+        """(Replay, Offset des nächsten Datensatzes)."""
+        magic, version, state, seed, goal, w, h, rescued, moves = HEADER.unpack_from(data, offset)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"kein Replay (Version {VERSION}) bei Byte {offset}")
+        start = offset + HEADER.size
+        end = start + 2 * moves
+        if end > len(data):
+            raise ValueError(f"Replay bei Byte {offset} ist abgeschnitten")
+        raw = data[start:end]
+        placements = list(zip(raw[0::2], raw[1::2]))
+        return cls(seed, goal, w, h, placements, STATES[state], rescued), end
+
+    def run(self, board=None):
+        """Spielt das Replay auf einer neuen Engine nach; gibt das Spiel zurück (None bei ungültigem Zug)."""
+        game = Game(self.goal, seed=self.seed, width=self.width, height=self.height, board=board)
+        place = game.place
+        for x, y in self.placements:
+            if place(x, y) is None:
+                return None
+        return game
+
+    def check(self, board=None):
+        """True, wenn das Nachspielen genau das aufgezeichnete Ergebnis liefert."""
+        game = self.run(board)
+        return (game is not None and game.rescued == self.rescued
+                and game.moves == self.moves and game.state == self.state)
+
+
+def save(path, replays, append=True):
+    with open(path, "ab" if append else "wb") as f:
+        for r in replays:
+            f.write(r.to_bytes())
+
+
+def load(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    replays = []
+    offset = 0
+    while offset < len(data):
+        r, offset = Replay.from_bytes(data, offset)
+        replays.append(r)
+    return replays
+
+
+def record_corpus(n, goal, width, height):
+    """``n`` Zufallsspiele mit Seeds 0..n-1 als Replays."""
+    out = []
+    for seed in range(n):
+        game = play(Game(goal, seed=seed, width=width, height=height),
+                    lambda g, r=random.Random(seed): random_policy(g, r))
+        out.append(Replay.from_game(game))
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("paths", nargs="*", help="Replay-Dateien")
+    ap.add_argument("--board", choices=("list", "bitboard"), help="Backend erzwingen")
+    ap.add_argument("--repeat", type=int, default=1, help="alles so oft nachspielen (Messung)")
+    ap.add_argument("--record", type=int, metavar="N", help="Korpus aus N Zufallsspielen erzeugen")
+    ap.add_argument("--out", default="replays.rpl")
+    ap.add_argument("--goal", type=int, default=256)
+    ap.add_argument("--size", default=f"{GRID_W}x{GRID_H}")
+    args = ap.parse_args()
+
+    if args.record:
+        w, h = (int(v) for v in args.size.lower().split("x"))
+        replays = record_corpus(args.record, args.goal, w, h)
+        save(args.out, replays, append=False)
+        print(f"{len(replays)} Replays, {sum(r.moves for r in replays)} Züge -> {args.out} "
+              f"({os.path.getsize(args.out) / 1024:.0f} KiB)")
+        return
+
+    replays = [r for path in args.paths for r in load(path)]
+    if not replays:
+        ap.error("keine Replays angegeben")
+    failed = 0
+    t = time.perf_counter()
+    for _ in range(args.repeat):
+        failed = sum(not r.check(args.board) for r in replays)
+    elapsed = time.perf_counter() - t
+    total = len(replays) * args.repeat
+    moves = sum(r.moves for r in replays) * args.repeat
+    print(f"{total} Replays in {elapsed:.2f}s: {total / elapsed:,.0f} Replays/s, "
+          f"{moves / elapsed:,.0f} Züge/s, {failed} abweichend")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""SQLite-Bestenliste: pro Schwierigkeitsstufe indiziert, Einfügen ohne Neuschreiben.
+
+Alle Einträge liegen in einer Tabelle; der Index ``(difficulty, score DESC,
+moves, id)`` macht daraus je Stufe eine sortierte Liste, sodass Top-K, Seiten
+und Rang eines Spielers ohne Sortieren der ganzen Historie beantwortet werden.
+"""
+import json
+import os
+import sqlite3
+import time
+
+from highscore import difficulty_for
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id         INTEGER PRIMARY KEY,
+    difficulty INTEGER NOT NULL,
+    name       TEXT    NOT NULL,
+    score      INTEGER NOT NULL,
+    moves      INTEGER,
+    created    REAL    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_rank ON scores (difficulty, score DESC, moves, id);
+CREATE INDEX IF NOT EXISTS scores_name ON scores (difficulty, name, score DESC);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class SQLiteScoreStore:
+    def __init__(self, path, migrate_from=None):
+        self.path = path
+        self.migrate_from = migrate_from  # alte highscores.json, wird einmalig übernommen
+        self._conn = None
+
+    def connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10.0)
+            conn.executescript(SCHEMA)
+            self._conn = conn
+            if self.migrate_from:
+                self.migrate_json(self.migrate_from)
+        return self._conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def migrate_json(self, json_path):
+        """Übernimmt eine alte highscores.json genau einmal (Vermerk in ``meta``)."""
+        conn = self.connect()
+        if conn.execute("SELECT 1 FROM meta WHERE key = 'json_migrated'").fetchone():
+            return 0
+        entries = []
+        try:
+            with open(json_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, list):
+                entries = [e for e in data if isinstance(e, dict) and "name" in e and "score" in e]
+        except (OSError, ValueError):
+            pass
+        now = time.time()
+        with conn:
+            # Schreibsperre vor der zweiten Prüfung: starten mehrere Instanzen
+            # gleichzeitig, übernimmt nur eine die alte Datei
+            conn.execute("BEGIN IMMEDIATE")
+            if conn.execute("SELECT 1 FROM meta WHERE key = 'json_migrated'").fetchone():
+                return 0
+            conn.executemany(
+                "INSERT INTO scores (difficulty, name, score, moves, created) VALUES (?, ?, ?, ?, ?)",
+                [(int(e.get("difficulty") or difficulty_for(int(e["score"]))), str(e["name"]),
+                  int(e["score"]), e.get("moves"), now) for e in entries])
+            conn.execute("INSERT INTO meta (key, value) VALUES ('json_migrated', ?)", (json_path,))
+        return len(entries)
+
+    def add(self, name, score, difficulty, moves=None):
+        self.add_many([(name, score, difficulty, moves)])
+
+    def add_many(self, entries):
+        """Mehrere (name, score, difficulty, moves) in einer Transaktion."""
+        conn = self.connect()
+        now = time.time()
+        with conn:
+            conn.executemany(
+                "INSERT INTO scores (difficulty, name, score, moves, created) VALUES (?, ?, ?, ?, ?)",
+                [(int(d), str(n), int(s), None if m is None else int(m), now) for n, s, d, m in entries])
+
+    def top(self, difficulty=None, limit=10, offset=0):
+        """Seite der Bestenliste: Einträge ``offset .. offset+limit`` als Dicts."""
+        conn = self.connect()
+        if difficulty is None:
+            rows = conn.execute(
+                "SELECT name, score, moves, difficulty FROM scores "
+                "ORDER BY score DESC, moves, id LIMIT ? OFFSET ?", (limit, offset))
+        else:
+            rows = conn.execute(
+                "SELECT name, score, moves, difficulty FROM scores WHERE difficulty = ? "
+                "ORDER BY score DESC, moves, id LIMIT ? OFFSET ?", (difficulty, limit, offset))
+        return [{"name": n, "score": s, "moves": m, "difficulty": d} for n, s, m, d in rows]
+
+    def rank(self, difficulty, name):
+        """Platz des besten Eintrags von ``name`` (1 = Erster) oder None."""
+        conn = self.connect()
+        row = conn.execute(
+            "SELECT MAX(score) FROM scores WHERE difficulty = ? AND name = ?",
+            (difficulty, name)).fetchone()
+        if row is None or row[0] is None:
+            return None
+        better = conn.execute(
+            "SELECT COUNT(*) FROM scores WHERE difficulty = ? AND score > ?",
+            (difficulty, row[0])).fetchone()[0]
+        return better + 1
+
+    def count(self, difficulty=None):
+        conn = self.connect()
+        if difficulty is None:
+            return conn.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+        return conn.execute("SELECT COUNT(*) FROM scores WHERE difficulty = ?", (difficulty,)).fetchone()[0]
@@ -0,0 +1,250 @@
+"""Spiel-Server: viele Partien gleichzeitig über zeilenweises JSON auf TCP (asyncio, ohne pygame).
+
+Aufruf:  python server.py [--host 127.0.0.1] [--port 8765] [--size 6x6] [--idle 300]
+                          [--max-sessions 100000]
+
+Protokoll: eine JSON-Anfrage pro Zeile, eine JSON-Antwort pro Zeile in derselben
+Reihenfolge. Ein optionales ``"id"`` wird unverändert zurückgegeben.
+
+  {"op": "new", "difficulty": 256}                 neue Partie (optional "seed")
+  {"op": "place", "session": S, "x": gx, "y": gy}  aktuelles Paar setzen
+  {"op": "state", "session": S}                    Stand abfragen
+
+Antworten haben ``"ok": true`` und ``"state"`` (bei place zusätzlich
+``"cleared"`` als [x, y, huhn]) oder ``"ok": false`` und ``"error"``.
+``state["board"]`` ist eine Liste von Spalten, ``board[x][y]`` ist ``"."``
+(leer) oder die Hühnerziffer.
+
+Die Regeln sind die von ``engine.place_on_board``. Jede Sitzung hält nur den
+Brettschlüssel (``BitBoard.key()``), die Indizes der beiden Paare und einen
+64-Bit-Zufallszustand; gespielt wird auf einem gemeinsamen Arbeitsbrett, das vor
+jedem Zug mit ``BitBoard.load`` geladen wird. Die Paare sind gleichverteilt wie
+bei ``new_pair``, aber aus einem eigenen Generator: ein Seed ergibt andere
+Partien als ``engine.Game``. Sitzungen, die länger als ``idle`` Sekunden nicht
+benutzt wurden, fliegen raus (älteste zuerst, wie im LRU-Cache).
+"""
+import argparse
+import asyncio
+import json
+import secrets
+import time
+from collections import OrderedDict
+
+from board import BitBoard, pair_kind
+from engine import ALL_PAIRS, BITBOARD_MAX_CELLS, CHICKEN_TYPES, GRID_W, GRID_H, place_on_board
+from highscore import DIFFICULTIES
+
+MASK64 = (1 << 64) - 1
+LINE_LIMIT = 64 * 1024
+
+
+def splitmix64(state):
+    """Nächster Zustand und 64-Bit-Zufallswert."""
+    state = (state + 0x9E3779B97F4A7C15) & MASK64
+    z = state
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+    return state, z ^ (z >> 31)
+
+
+class Session:
+    """Kompakter Stand einer Partie (ein paar Integer statt Game samt Mersenne-Twister)."""
+
+    __slots__ = ("token", "goal", "key", "cur", "nxt", "rng", "rescued", "moves", "state", "last_seen")
+
+    def __init__(self, token, goal, seed, types):
+        self.token = token
+        self.goal = goal
+        self.key = (0,) * types
+        self.rng = seed & MASK64
+        self.cur = self.draw_pair()
+        self.nxt = self.draw_pair()
+        self.rescued = 0
+        self.moves = 0
+        self.state = "playing"
+        self.last_seen = time.monotonic()
+
+    def draw_pair(self):
+        """Index in ``ALL_PAIRS``; 32 teilt 2**64, also gleichverteilt."""
+        self.rng, r = splitmix64(self.rng)
+        return r % len(ALL_PAIRS)
+
+
+def pair_info(index):
+    offsets = ALL_PAIRS[index]
+    return {"colors": [offsets[0][2], offsets[1][2]], "orientation": pair_kind(offsets)}
+
+
+class GameServer:
+    def __init__(self, width=GRID_W, height=GRID_H, idle=300.0, max_sessions=100_000):
+        if width * height > BITBOARD_MAX_CELLS:
+            raise ValueError(f"Brett {width}x{height} zu groß für den Server (max. {BITBOARD_MAX_CELLS} Zellen)")
+        self.width = width
+        self.height = height
+        self.idle = idle
+        self.max_sessions = max_sessions
+        self.sessions = OrderedDict()  # token -> Session, zuletzt benutzte hinten
+        self.board = BitBoard(width, height, CHICKEN_TYPES)  # Arbeitsbrett für alle Sitzungen
+        self.moves = 0
+        self.evicted = 0
+        self.clients = 0
+
+    # --- Anfragen ---
+    def handle(self, request):
+        """Eine dekodierte Anfrage -> Antwort-Dict (synchron, ohne Netzwerk)."""
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "Anfrage muss ein JSON-Objekt sein"}
+        op = request.get("op")
+        try:
+            if op == "new":
+                response = self.op_new(request)
+            elif op == "place":
+                response = self.op_place(request)
+            elif op == "state":
+                response = {"ok": True, "state": self.state_of(self.session(request))}
+            else:
+                response = {"ok": False, "error": f"unbekannte Operation {op!r}"}
+        except (KeyError, TypeError, ValueError) as e:
+            response = {"ok": False, "error": str(e.args[0]) if e.args else type(e).__name__}
+        if "id" in request:
+            response["id"] = request["id"]
+        return response
+
+    def session(self, request):
+        token = request.get("session")
+        s = self.sessions.get(token)
+        if s is None:
+            raise KeyError(f"unbekannte oder abgelaufene Sitzung {token!r}")
+        s.last_seen = time.monotonic()
+        self.sessions.move_to_end(token)
+        return s
+
+    def op_new(self, request):
+        goal = request.get("difficulty", DIFFICULTIES[1])
+        if type(goal) is not int or goal not in DIFFICULTIES:  # 256.0 und true zählen nicht
+            raise ValueError(f"Schwierigkeit muss eine von {list(DIFFICULTIES)} sein")
+        seed = request.get("seed")
+        if seed is None:
+            seed = secrets.randbits(64)
+        elif type(seed) is not int:
+            raise TypeError("seed muss eine Ganzzahl sein")
+        while len(self.sessions) >= self.max_sessions:
+            self.sessions.popitem(last=False)
+            self.evicted += 1
+        token = secrets.token_urlsafe(12)
+        s = self.sessions[token] = Session(token, goal, seed, CHICKEN_TYPES)
+        return {"ok": True, "state": self.state_of(s)}
+
+    def op_place(self, request):
+        s = self.session(request)
+        x, y = request.get("x"), request.get("y")
+        if not (type(x) is int and type(y) is int):  # bool ist auch ein int
+            raise TypeError("x und y müssen Ganzzahlen sein")
+        if s.state != "playing":
+            return {"ok": False, "error": f"Partie ist beendet ({s.state})", "state": self.state_of(s)}
+        board = self.board
+        board.load(s.key)
+        offsets = ALL_PAIRS[s.cur]
+        if not board.can_place(x, y, offsets):
+            return {"ok": False, "error": f"Paar passt nicht an ({x}, {y})"}
+        cleared = place_on_board(board, x, y, offsets)
+        s.key = board.key()
+        s.rescued += len(cleared)
+        s.moves += 1
+        s.cur, s.nxt = s.nxt, s.draw_pair()
+        if s.rescued >= s.goal:
+            s.state = "victory"
+        elif not board.any_move_possible(ALL_PAIRS[s.cur]):
+            s.state = "gameover"
+        self.moves += 1
+        return {"ok": True, "cleared": [list(c) for c in cleared], "state": self.state_of(s)}
+
+    def state_of(self, s):
+        w, h, stride = self.width, self.height, self.height + 1
+        cells = bytearray(b"." * (w * h))
+        for c, m in enumerate(s.key):
+            digit = 48 + c
+            while m:
+                low = m & -m
+                i = low.bit_length() - 1
+                cells[i // stride * h + i % stride] = digit
+                m ^= low
+        text = cells.decode("ascii")
+        return {"session": s.token, "goal": s.goal, "width": w, "height": h,
+                "board": [text[x * h:(x + 1) * h] for x in range(w)],
+                "current": pair_info(s.cur), "next": pair_info(s.nxt),
+                "rescued": s.rescued, "moves": s.moves, "state": s.state}
+
+    def evict_idle(self, now=None):
+        """Wirft Sitzungen raus, die länger als ``idle`` Sekunden unbenutzt sind; gibt die Anzahl zurück."""
+        limit = (time.monotonic() if now is None else now) - self.idle
+        sessions, n = self.sessions, 0
+        while sessions:
+            s = next(iter(sessions.values()))
+            if s.last_seen > limit:
+                break
+            sessions.popitem(last=False)
+            n += 1
+        self.evicted += n
+        return n
+
+    # --- Netzwerk ---
+    async def serve_client(self, reader, writer):
+        self.clients += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, ConnectionError):  # Zeile zu lang oder Verbindung weg
+                    break
+                if not line:
+                    break
+                try:
+                    response = self.handle(json.loads(line))
+                except ValueError:
+                    response = {"ok": False, "error": "kein gültiges JSON"}
+                writer.write(json.dumps(response, separators=(",", ":")).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.clients -= 1
+            writer.close()
+
+    async def evict_loop(self, verbose=False):
+        while True:
+            await asyncio.sleep(max(self.idle / 4, 0.5))
+            n = self.evict_idle()
+            if verbose and n:
+                print(f"{n} Sitzungen abgelaufen, {len(self.sessions)} aktiv, {self.clients} Verbindungen")
+
+    async def serve(self, host, port, verbose=True):
+        server = await asyncio.start_server(self.serve_client, host, port, limit=LINE_LIMIT)
+        if verbose:
+            addr = ", ".join(str(sock.getsockname()[:2]) for sock in server.sockets)
+            print(f"Server lauscht auf {addr}, Brett {self.width}x{self.height}, idle {self.idle:g}s")
+        evictor = asyncio.create_task(self.evict_loop(verbose))
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            evictor.cancel()
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--size", default=f"{GRID_W}x{GRID_H}")
+    ap.add_argument("--idle", type=float, default=300.0, help="Sekunden bis eine unbenutzte Sitzung verfällt")
+    ap.add_argument("--max-sessions", type=int, default=100_000)
+    args = ap.parse_args()
+    w, h = (int(v) for v in args.size.lower().split("x"))
+    try:
+        asyncio.run(GameServer(w, h, args.idle, args.max_sessions).serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""Kompakte Spielstände: Brett mit 3 Bit pro Zelle plus Paare, Zähler, Ziel und Zufallszustand (ohne pygame).
+
+Aufruf:  python snapshot.py [--games 1000] [--size 6x6] [--goal 256]
+         spielt Zufallsstellungen, prüft Kodieren/Dekodieren und misst beides.
+
+Aufbau (little endian):
+  Kopf ``HEADER`` (Magic, Version, Flags, Breite, Höhe, Ziel, gerettet, Züge,
+  Seed, aktuelles und nächstes Paar), danach das Brett als drei Bitebenen zu je
+  Breite x Höhe Bit (Zellwert 0 = leer, 1..4 = Huhn + 1, Zellen in der
+  ``for x: for y:``-Reihenfolge der Bretter). Ein 6x6-Stand hat 44 Byte.
+  Mit ``history`` folgen 2 Byte (x, y) pro Zug, damit ein fortgesetztes Spiel
+  weiterhin als Replay gespeichert werden kann.
+
+Der Zufallszustand ist Seed plus Position: ``Game.rng`` zieht nur Paare, zwei
+am Anfang und eins pro Zug. Beim Laden wird der Generator um ``moves`` Paare
+vorgespult, statt 2,5 KB Mersenne-Twister-Zustand zu speichern.
+
+``encode`` ist ein vollständiger Spielstand (Wert in Speichern); weil Seed und
+Zugzahl im Kopf stehen, ergeben gleiche Stellungen aus verschiedenen Spielen
+verschiedene Bytes. Als Schlüssel dient ``position_key``: nur Größe, fehlende
+Hühner bis zum Ziel, die beiden Paare und dieselben Bitebenen.
+"""
+import argparse
+import os
+import random
+import struct
+import tempfile
+import time
+from array import array
+
+from board import BitBoard
+from engine import CHICKEN_TYPES, GRID_W, GRID_H, Game, new_pair, random_policy
+
+MAGIC = b"CK"
+VERSION = 1
+HISTORY = 1  # Flag: Züge hängen an
+# Magic, Version, Flags, Breite, Höhe, Ziel, gerettet, Züge, Seed, aktuelles Paar, nächstes Paar
+HEADER = struct.Struct("<2sBBHHIIIQBB")
+# Breite, Höhe, fehlende Hühner, aktuelles Paar, nächstes Paar
+POSITION = struct.Struct("<HHIBB")
+BITS = 3  # Zellwerte 0..7: leer + bis zu 7 Hühnertypen
+
+# Zellbytes: -1 (leer, als Byte 255) -> 0, Huhn c -> c + 1
+_SHIFT = bytes((b + 1) & 0xFF for b in range(256))
+# Zellwert -> ASCII '0'/'1' für Bit k (Bitebene als Binärzahl lesen)
+_PLANE = [bytes(48 + (b >> k & 1) for b in range(256)) for k in range(BITS)]
+_DIGIT = bytes(b - 48 if b in (48, 49) else 0 for b in range(256))
+
+
+def pair_code(pair):
+    """Paar aus ``new_pair`` -> 0..2*T*T-1 (Farben und Ausrichtung)."""
+    offsets, orientation = pair
+    return (offsets[0][2] * CHICKEN_TYPES + offsets[1][2]) * 2 + (orientation == "v")
+
+
+def code_pair(code):
+    """Gegenstück zu ``pair_code``, im Format von ``new_pair``."""
+    colors, vertical = divmod(code, 2)
+    c1, c2 = divmod(colors, CHICKEN_TYPES)
+    if vertical:
+        return [(0, 0, c1), (0, 1, c2)], "v"
+    return [(0, 0, c1), (1, 0, c2)], "h"
+
+
+def _planes(board):
+    """Brett -> die drei Bitebenen als eine Zahl (Ebene k ab Bit k * Zellenzahl)."""
+    w, h = board.width, board.height
+    n = w * h
+    planes = [0] * BITS
+    if isinstance(board, BitBoard):
+        # Masken direkt: Wächterbits je Spalte herausschieben
+        stride, column = board.stride, (1 << h) - 1
+        for c, m in enumerate(board.masks):
+            if not m:
+                continue
+            packed = 0
+            for x in range(w):
+                packed |= (m >> (x * stride) & column) << (x * h)
+            for k in range(BITS):
+                if (c + 1) >> k & 1:
+                    planes[k] |= packed
+    else:
+        values = b"".join(array("b", col).tobytes() for col in board.grid).translate(_SHIFT)
+        for k in range(BITS):
+            planes[k] = int(values.translate(_PLANE[k])[::-1], 2)
+    return sum(p << (k * n) for k, p in enumerate(planes))
+
+
+def _values(planes, n):
+    """Gegenstück zu ``_planes``: ein Byte pro Zelle mit dem Zellwert."""
+    total = 0
+    for k in range(BITS):
+        bits = format(planes >> (k * n) & ((1 << n) - 1), f"0{n}b")[::-1]
+        total += int.from_bytes(bits.encode("ascii").translate(_DIGIT), "little") << k
+    return total.to_bytes(n, "little")
+
+
+def encode(game, history=False):
+    """Spielstand als Bytes; ``history`` hängt die gespielten Plätze an."""
+    n = game.width * game.height
+    head = HEADER.pack(MAGIC, VERSION, HISTORY if history else 0, game.width, game.height,
+                       game.goal, game.rescued, game.moves, game.seed,
+                       pair_code(game.current_pair), pair_code(game.next_pair))
+    data = head + _planes(game.board).to_bytes((BITS * n + 7) // 8, "little")
+    if history:
+        data += bytes(v for xy in game.placements for v in xy)
+    return data
+
+
+def position_key(game):
+    """Nur die Stellung als Bytes: gleich für gleiche Stellungen, egal aus welchem Spiel."""
+    n = game.width * game.height
+    head = POSITION.pack(game.width, game.height, max(game.goal - game.rescued, 0),
+                         pair_code(game.current_pair), pair_code(game.next_pair))
+    return head + _planes(game.board).to_bytes((BITS * n + 7) // 8, "little")
+
+
+def decode(data, board=None):
+    """Bytes aus ``encode`` -> laufendes ``engine.Game`` (``board`` wählt das Backend)."""
+    if len(data) < HEADER.size:
+        raise ValueError("Spielstand ist abgeschnitten")
+    magic, version, flags, w, h, goal, rescued, moves, seed, cur, nxt = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"kein Spielstand (Version {VERSION})")
+    n = w * h
+    start = HEADER.size
+    end = start + (BITS * n + 7) // 8
+    history = data[end:end + 2 * moves] if flags & HISTORY else None
+    if len(data) < end or (history is not None and len(history) < 2 * moves):
+        raise ValueError("Spielstand ist abgeschnitten")
+
+    game = Game(goal, seed=seed, width=w, height=h, board=board)
+    values = _values(int.from_bytes(data[start:end], "little"), n)
+    if max(values, default=0) > CHICKEN_TYPES:
+        raise ValueError("ungültiger Zellwert im Spielstand")
+    set_cell = game.board.set
+    for i, v in enumerate(values):
+        if v:
+            set_cell(i // h, i % h, v - 1)
+    for _ in range(moves):  # Generator auf den Stand nach ``moves`` Zügen bringen
+        new_pair(game.rng)
+    game.current_pair, game.next_pair = code_pair(cur), code_pair(nxt)
+    game.rescued = rescued
+    game.moves = moves
+    if history is not None:
+        game.placements = list(zip(history[0::2], history[1::2]))
+    if rescued >= goal:
+        game.state = "victory"
+    elif not game.any_move_possible():
+        game.state = "gameover"
+    return game
+
+
+def save(path, game):
+    """Schreibt den Spielstand samt Zügen atomar (Tempfile + replace)."""
+    folder = os.path.dirname(path) or "."
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix="save_", dir=folder)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(encode(game, history=True))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def load(path, board=None):
+    with open(path, "rb") as f:
+        return decode(f.read(), board)
+
+
+def same_game(a, b):
+    return (a.width == b.width and a.height == b.height and a.goal == b.goal
+            and a.rescued == b.rescued and a.moves == b.moves and a.state == b.state
+            and a.board.key() == b.board.key() and a.placements == b.placements
+            and pair_code(a.current_pair) == pair_code(b.current_pair)
+            and pair_code(a.next_pair) == pair_code(b.next_pair))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--games", type=int, default=1000)
+    ap.add_argument("--size", default=f"{GRID_W}x{GRID_H}")
+    ap.add_argument("--goal", type=int, default=256)
+    args = ap.parse_args()
+    w, h = (int(v) for v in args.size.lower().split("x"))
+
+    games = []
+    for seed in range(args.games):
+        rng = random.Random(seed)
+        game = Game(args.goal, seed=seed, width=w, height=h)
+        for _ in range(rng.randrange(60)):
+            if game.over:
+                break
+            game.place(*random_policy(game, rng))
+        games.append(game)
+
+    t = time.perf_counter()
+    blobs = [encode(g, history=True) for g in games]
+    t_enc = time.perf_counter() - t
+    t = time.perf_counter()
+    restored = [decode(b) for b in blobs]
+    t_dec = time.perf_counter() - t
+
+    bad = sum(not same_game(a, b) for a, b in zip(games, restored))
+    # fortgesetzte Spiele ziehen dieselben Paare weiter
+    for a, b in zip(games, restored):
+        if not a.over and not bad:
+            bad += new_pair(a.rng) != new_pair(b.rng)
+    size = sum(len(encode(g)) for g in games) / len(games)
+    print(f"{len(games)} Stände {w}x{h}: {size:.0f} Byte ohne Züge, "
+          f"Kodieren {t_enc / len(games) * 1e6:.1f} µs, Dekodieren {t_dec / len(games) * 1e6:.1f} µs, "
+          f"{bad} abweichend")
+
+
+if __name__ == "__main__":
+    main()
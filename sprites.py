@@ -0,0 +1,35 @@
+"""Hühner-Sprites: geblendete Varianten und Pop-Einzelbilder (pygame, ohne Fenster).
+
+Von main.py (über ``sprite_cache`` / ``pop_frame_cache``) und bench_render.py
+benutzt, damit die Messung denselben Code wie das Spiel zeitet.
+"""
+import pygame
+
+from effects import POP_FRAMES, pop_transform
+
+
+def blend(img, alpha=255, tint=None):
+    """``img`` mit Transparenz ``alpha`` und optionaler Farbe (rote Vorschau)."""
+    if tint:
+        temp = img.copy()
+        tint_surf = pygame.Surface(temp.get_size(), pygame.SRCALPHA)
+        tint_surf.fill((*tint, alpha))
+        temp.blit(tint_surf, (0,0), special_flags=pygame.BLEND_RGBA_MULT)
+        temp.set_alpha(255 if alpha >= 255 else alpha)
+        return temp
+    if alpha >= 255:
+        return img  # volle Deckkraft: Original direkt blitten
+    temp = img.copy()
+    temp.set_alpha(alpha)
+    return temp
+
+
+def pop_atlas(img):
+    """Die ``POP_FRAMES`` Einzelbilder der Pop-Animation von ``img``."""
+    frames = []
+    for i in range(POP_FRAMES):
+        scale, alpha, angle = pop_transform((i + 0.5) / POP_FRAMES)
+        frame = pygame.transform.rotozoom(img, angle, scale)
+        frame.set_alpha(alpha)
+        frames.append(frame)
+    return frames
@@ -0,0 +1,87 @@
+"""Stresstest: viele Prozesse tragen gleichzeitig Highscores ein, keiner darf verloren gehen.
+
+Aufruf:  python stress_scores.py [--procs 8] [--per-proc 50] [--backend both|json|sqlite]
+
+Jeder Prozess nutzt denselben (temporären) Datenordner wie mehrere Automaten,
+die sich ein Verzeichnis teilen. Damit die JSON-Datei nichts wegschneidet, wird
+TOP_N in den Prozessen hochgesetzt; am Ende muss jeder Eintrag genau einmal da sein.
+"""
+import argparse
+import multiprocessing as mp
+import os
+import sys
+import tempfile
+import time
+
+import highscore
+
+
+def configure(data_dir, backend):
+    highscore.BACKEND = backend
+    highscore.DATA_DIR = data_dir
+    highscore.SCORE_FILE = os.path.join(data_dir, "highscores.json")
+    highscore.SCORE_DB = os.path.join(data_dir, "highscores.db")
+    highscore.TOP_N = 10**9
+    highscore._store = None
+
+
+def worker(data_dir, backend, proc, per_proc, barrier, batch):
+    configure(data_dir, backend)
+    barrier.wait()  # alle gleichzeitig loslassen
+    failed = 0
+    for i in range(per_proc):
+        highscore.submit_score(f"p{proc}-{i}", 128 + (proc * per_proc + i) % 300, moves=i)
+        if (i + 1) % batch == 0 or i == per_proc - 1:
+            if not highscore.flush_scores():
+                failed += 1
+    return failed
+
+
+def run(backend, procs, per_proc, batch):
+    with tempfile.TemporaryDirectory(prefix="stress_scores_") as data_dir:
+        try:
+            return check(data_dir, backend, procs, per_proc, batch)
+        finally:
+            close = getattr(highscore._store, "close", None)
+            if close:
+                close()  # Datenbank zu, bevor der Ordner gelöscht wird
+            highscore._store = None
+
+
+def check(data_dir, backend, procs, per_proc, batch):
+    ctx = mp.get_context("spawn")
+    barrier = ctx.Manager().Barrier(procs)
+    t = time.perf_counter()
+    with ctx.Pool(procs) as pool:
+        failed = sum(pool.starmap(worker, [(data_dir, backend, p, per_proc, barrier, batch)
+                                          for p in range(procs)]))
+    elapsed = time.perf_counter() - t
+
+    configure(data_dir, backend)
+    names = [e["name"] for level in highscore.DIFFICULTIES
+             for e in highscore.get_store().top(level, limit=10**9)]
+    expected = {f"p{p}-{i}" for p in range(procs) for i in range(per_proc)}
+    lost = expected - set(names)
+    dupes = len(names) - len(set(names))
+    ok = not lost and not dupes and not failed
+    print(f"{backend:<7} {procs} Prozesse x {per_proc}: {len(names)}/{len(expected)} Einträge, "
+          f"{len(lost)} verloren, {dupes} doppelt, {failed} Fehler, {elapsed:.2f}s  "
+          f"{'OK' if ok else 'FEHLER'}")
+    return ok
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--procs", type=int, default=8)
+    ap.add_argument("--per-proc", type=int, default=50)
+    ap.add_argument("--batch", type=int, default=1, help="Einträge pro Group-Commit")
+    ap.add_argument("--backend", choices=("both", "json", "sqlite"), default="both")
+    args = ap.parse_args()
+
+    backends = ("json", "sqlite") if args.backend == "both" else (args.backend,)
+    ok = all([run(b, args.procs, args.per_proc, args.batch) for b in backends])
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Sichtfenster auf das Brett – Scrollen und Zoomen für große Bretter (ohne pygame).
+
+Gezeichnet und angeklickt wird nur, was im Fenster liegt. Damit hängt die
+Zeichenzeit pro Frame von der Fenstergröße ab, nicht von der Brettgröße.
+"""
+
+# Kachelgrößen in Pixel, vom Standard (72) abwärts
+ZOOM_LEVELS = (72, 54, 36, 24, 18)
+
+
+def inner_size(tile):
+    """Kantenlänge eines Huhns innerhalb einer Kachel (72 -> 68 wie bisher)."""
+    return tile - max(1, tile * 4 // 72)
+
+
+class Viewport:
+    def __init__(self, grid_w, grid_h, px_w, px_h, left, top, tile=ZOOM_LEVELS[0]):
+        self.grid_w = grid_w
+        self.grid_h = grid_h
+        self.px_w = px_w    # Pixelgröße des Brettbereichs
+        self.px_h = px_h
+        self.left = left    # Bildschirmposition des Brettbereichs
+        self.top = top
+        # nur so weit herauszoomen, bis das ganze Brett hineinpasst
+        self.levels = []
+        for t in ZOOM_LEVELS:
+            self.levels.append(t)
+            if grid_w * t <= px_w and grid_h * t <= px_h:
+                break
+        self.tile = tile if tile in self.levels else self.levels[0]
+        self.x0 = 0  # linke obere sichtbare Kachel
+        self.y0 = 0
+
+    @property
+    def cols(self):
+        return min(self.grid_w, self.px_w // self.tile)
+
+    @property
+    def rows(self):
+        return min(self.grid_h, self.px_h // self.tile)
+
+    @property
+    def inner(self):
+        return inner_size(self.tile)
+
+    @property
+    def scrollable(self):
+        return self.cols < self.grid_w or self.rows < self.grid_h
+
+    def visible(self):
+        """Sichtbare Kacheln als halboffene Bereiche (x0, x1, y0, y1)."""
+        return self.x0, self.x0 + self.cols, self.y0, self.y0 + self.rows
+
+    def contains(self, gx, gy):
+        return self.x0 <= gx < self.x0 + self.cols and self.y0 <= gy < self.y0 + self.rows
+
+    def tiles_in(self, left, top, width, height):
+        """Sichtbare Kacheln, die ein Pixelrechteck schneiden (halboffene Bereiche)."""
+        t = self.tile
+        x0 = max(self.x0, self.x0 + (left - self.left) // t)
+        y0 = max(self.y0, self.y0 + (top - self.top) // t)
+        x1 = min(self.x0 + self.cols, self.x0 + (left + width - 1 - self.left) // t + 1)
+        y1 = min(self.y0 + self.rows, self.y0 + (top + height - 1 - self.top) // t + 1)
+        return x0, max(x0, x1), y0, max(y0, y1)
+
+    def tile_pos(self, gx, gy):
+        """Bildschirmposition (links oben) der Kachel (gx, gy)."""
+        return (self.left + (gx - self.x0) * self.tile,
+                self.top + (gy - self.y0) * self.tile)
+
+    def to_grid(self, mx, my):
+        """Brettkoordinate unter dem Mauszeiger oder None außerhalb des Fensters."""
+        cx = (mx - self.left) // self.tile
+        cy = (my - self.top) // self.tile
+        if 0 <= cx < self.cols and 0 <= cy < self.rows:
+            return self.x0 + cx, self.y0 + cy
+        return None
+
+    def _clamp(self):
+        self.x0 = max(0, min(self.x0, self.grid_w - self.cols))
+        self.y0 = max(0, min(self.y0, self.grid_h - self.rows))
+
+    def scroll(self, dx, dy):
+        self.x0 += dx
+        self.y0 += dy
+        self._clamp()
+
+    def zoom(self, step, anchor=None):
+        """Eine Zoomstufe rein (step < 0) oder raus (step > 0); ``anchor`` bleibt stehen."""
+        i = self.levels.index(self.tile)
+        j = max(0, min(len(self.levels) - 1, i + step))
+        if i == j:
+            return
+        cell = self.to_grid(*anchor) if anchor else None
+        if cell is None:
+            cell = (self.x0 + self.cols // 2, self.y0 + self.rows // 2)
+            anchor = self.tile_pos(*cell)
+        self.tile = self.levels[j]
+        self.x0 = cell[0] - (anchor[0] - self.left) // self.tile
+        self.y0 = cell[1] - (anchor[1] - self.top) // self.tile
+        self._clamp()